@@ -84,6 +84,8 @@ class AppVars:
         self.tool_ignore_list = ["json", "txt"]
         self.tools_temp_dir = os.path.join(self.local_temp_dir, "pyanitools")
         self.preferences_filename = os.path.join(self.persistent_data_path, "pref.json")
+        # modification time and size of the nuke init.py when the custom plugin path was last confirmed in it
+        self.nuke_init_state_file = os.path.join(self.persistent_data_path, "nuke_init_state.json")
         self.preferences_template = {
             "asset mngr": {
                 "audio": {
@@ -277,3 +279,21 @@ class AppVars:
 
     def __repr__(self):
         return '<pyani.core.appvars.AppVars>'
+
+
+# shared instance, see get_app_vars()
+_app_vars = None
+
+
+def get_app_vars():
+    """
+    Returns a shared AppVars instance, building it on first use. AppVars builds a large number of paths and reads the
+    environment, so managers and windows share one instance rather than each building their own. Nothing modifies
+    AppVars after construction so sharing is safe. Note AniVars is not shared this way since it changes when the
+    sequence or shot is updated.
+    :return: the AppVars object
+    """
+    global _app_vars
+    if _app_vars is None:
+        _app_vars = AppVars()
+    return _app_vars
@@ -1,17 +1,129 @@
 import logging
+import logging.handlers
 import os
 import datetime
+import threading
+import atexit
+import copy
+import Queue
 import pyani.core.util
 import pyani.core.appvars
 
 
+class QueueHandler(logging.Handler):
+    """
+    Python 2.7 doesn't have logging.handlers.QueueHandler, so this is a minimal version. Records are put on a queue
+    so logging calls only enqueue, and a QueueListener writes them to the real handler(s) on a background thread
+    """
+    def __init__(self, queue):
+        logging.Handler.__init__(self)
+        self.queue = queue
+
+    def emit(self, record):
+        try:
+            # format now so the message and any exception text are resolved on the calling thread, args may
+            # not be safe to read later. Format a copy, other handlers get the same record and need it unchanged
+            msg = self.format(record)
+            record = copy.copy(record)
+            record.msg = msg
+            record.args = None
+            record.exc_info = None
+            record.exc_text = None
+            self.queue.put_nowait(record)
+        except Exception:
+            self.handleError(record)
+
+
+class QueueListener(object):
+    """
+    Pulls records off a queue on a daemon thread and passes them to the handlers provided. Minimal version of
+    python 3's logging.handlers.QueueListener
+    """
+    _sentinel = None
+
+    def __init__(self, queue, *handlers):
+        self.queue = queue
+        self.handlers = handlers
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._monitor)
+        self._thread.setDaemon(True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Lets the thread write any records still queued and waits for it to finish
+        """
+        if self._thread:
+            self.queue.put_nowait(self._sentinel)
+            self._thread.join()
+            self._thread = None
+
+    def flush(self):
+        """
+        Waits until every record queued so far has been passed to the handlers
+        """
+        if self._thread:
+            self.queue.join()
+
+    def _monitor(self):
+        while True:
+            record = self.queue.get()
+            try:
+                if record is self._sentinel:
+                    break
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            finally:
+                self.queue.task_done()
+
+
+class BufferingHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that also writes its buffer flush_interval seconds after a record is buffered, using a timer
+    thread, so records logged before the app goes quiet don't stay in memory until the next log call or exit
+    """
+    def __init__(self, capacity, flush_interval, flushLevel=logging.ERROR, target=None):
+        logging.handlers.MemoryHandler.__init__(self, capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval
+        self._flush_timer = None
+
+    def emit(self, record):
+        logging.handlers.MemoryHandler.emit(self, record)
+        # start the timer for the first record of a new batch, flush cancels it when the buffer is written sooner
+        if self.buffer and self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.setDaemon(True)
+            self._flush_timer.start()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            logging.handlers.MemoryHandler.flush(self)
+        finally:
+            self.release()
+
+
 class ErrorLogging:
-    def __init__(self, app_name, error_level=logging.DEBUG):
+    def __init__(self, app_name, error_level=logging.DEBUG, use_queue=True, buffer_records=32, flush_interval=2.0):
         """
         Sets up the python logging class for an app. Creates the root config logger, and log directory if it doesn't exist
         Cleans up logs older than a week
         :param app_name: name of app
         :param error_level: level of errors to log, default to DEBUG
+        :param use_queue: when True log records are queued and written to the log file on a background thread, so
+        logging doesn't block on disk i/o. Defaults to True
+        :param buffer_records: number of log records held in memory and written to the log file together. Records at
+        error level or above write the buffer right away. 0 writes every record as it's logged. Defaults to 32.
+        Buffered records are lost if the app crashes hard (killed, or the interpreter aborts) before they are
+        written, so a larger buffer means fewer writes but more log lost in a crash
+        :param flush_interval: seconds a record can sit in the buffer before a timer writes the buffer. Defaults to 2
+        seconds
         """
 
         self.__error_log_list = []
@@ -20,7 +132,7 @@ class ErrorLogging:
         self.__days_to_keep_log = 7
 
         # setup log file name
-        app_vars = pyani.core.appvars.AppVars()
+        app_vars = pyani.core.appvars.get_app_vars()
         now = datetime.datetime.now()
         time_stamp = now.strftime("%Y-%m-%d_%H-%M")
         self.__tools_dir = os.path.normpath(app_vars.tools_dir)
@@ -30,6 +142,11 @@ class ErrorLogging:
         self.__app_name = app_name
 
         self.__error_level = error_level
+        self.__use_queue = use_queue
+        self.__queue_listener = None
+        self.__buffer_records = buffer_records
+        self.__flush_interval = flush_interval
+        self.__buffer_handler = None
 
     @property
     def app_name(self):
@@ -107,9 +224,56 @@ class ErrorLogging:
                 f_handler.setLevel(self.error_level)
                 formatter = logging.Formatter("(%(levelname)s)  %(lineno)d. %(pathname)s - %(funcName)s: %(message)s")
                 f_handler.setFormatter(formatter)
-                root_logger.addHandler(f_handler)
+                if self.__use_queue:
+                    # record is already formatted by the queue handler
+                    f_handler.setFormatter(logging.Formatter("%(message)s"))
+                # batch records into fewer writes to the log file
+                if self.__buffer_records:
+                    self.__buffer_handler = BufferingHandler(
+                        self.__buffer_records,
+                        self.__flush_interval,
+                        flushLevel=logging.ERROR,
+                        target=f_handler
+                    )
+                    self.__buffer_handler.setLevel(self.error_level)
+                    log_handler = self.__buffer_handler
+                else:
+                    log_handler = f_handler
+                if self.__use_queue:
+                    # the file handler is owned by the listener thread, logging calls just enqueue the record
+                    log_queue = Queue.Queue(-1)
+                    q_handler = QueueHandler(log_queue)
+                    q_handler.setLevel(self.error_level)
+                    q_handler.setFormatter(formatter)
+                    self.__queue_listener = QueueListener(log_queue, log_handler)
+                    self.__queue_listener.start()
+                    root_logger.addHandler(q_handler)
+                else:
+                    root_logger.addHandler(log_handler)
+                # make sure queued and buffered records are written and the listener thread stopped before the
+                # app exits
+                atexit.register(self.close)
             except (IOError, OSError, WindowsError, EnvironmentError) as e:
                 self.__error_log_list.append(
                     "Could not create root logger in ErrorLogging class for {0}".format(self.app_name)
                 )
 
+    def flush(self):
+        """
+        Writes any queued or buffered log records to the log file. Call it to get the log file up to date sooner,
+        for example when a long task finishes
+        """
+        if self.__queue_listener:
+            self.__queue_listener.flush()
+        if self.__buffer_handler:
+            self.__buffer_handler.flush()
+
+    def close(self):
+        """
+        Writes any queued or buffered log records to the log file and stops the queue listener thread. Called
+        automatically when the app exits
+        """
+        if self.__queue_listener:
+            self.__queue_listener.stop()
+            self.__queue_listener = None
+        self.flush()
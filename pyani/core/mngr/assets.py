@@ -591,8 +591,8 @@ class AniAssetMngr(AniCoreMngr):
         """
 
         # reset threads counters
-        self.thread_total = 0.0
-        self.threads_done = 0.0
+        self.thread_total = 0
+        self.threads_done = 0
 
         # no asset types, so can't set any other values in data struct, so rebuild entire cache
         if not update_data_dict:
@@ -684,7 +684,7 @@ class AniAssetMngr(AniCoreMngr):
                                     local_file_paths=[local_path],
                                     update_local_version=True
                                 )
-                                self.thread_total += 1.0
+                                self.thread_total += 1
                                 self.thread_pool.start(worker)
 
                                 # slot that is called when a thread finishes
@@ -781,7 +781,7 @@ class AniAssetMngr(AniCoreMngr):
                     asset_component,
                     asset_names=asset_names
                 )
-                self.thread_total += 1.0
+                self.thread_total += 1
                 self.thread_pool.start(worker)
                 # reset error list
                 self.init_thread_error()
@@ -1126,8 +1126,8 @@ class AniAssetMngr(AniCoreMngr):
 
     def _reset_thread_counters(self):
         # reset threads counters
-        self.thread_total = 0.0
-        self.threads_done = 0.0
+        self.thread_total = 0
+        self.threads_done = 0
 
     def _check_for_new_audio(self, seqs=None):
         """
@@ -1213,7 +1213,7 @@ class AniAssetMngr(AniCoreMngr):
                     audio_server_file_info,
                     self.ani_vars.shot_audio_dir
                 )
-                self.thread_total += 1.0
+                self.thread_total += 1
                 self.thread_pool.start(worker)
                 # reset error list
                 self.init_thread_error()
@@ -1308,25 +1308,17 @@ class AniAssetMngr(AniCoreMngr):
         """
         Called when a thread that checks an audio's timestamp completes
         """
-        # a thread finished, increment our count
-        self.threads_done += 1.0
-        if self.threads_done > self.thread_total:
-            return
-        else:
-            # get the current progress percentage
-            progress = (self.threads_done / self.thread_total) * 100.0
-
-            self.progress_win.setValue(progress)
-            # check if we are finished
-            if progress >= 100.0:
-                # create excel report
-                filename, error = self._generate_report_for_changed_audio()
-                if error:
-                    self.send_thread_error(error)
-                    return error
-                # done, let any listening objects/classes know we are finished, pass "audio" in case listeners want
-                # to know what is sending this signal
-                self.finished_tracking.emit(("audio", filename))
+        progress = self._tick_thread_progress()
+        # check if we are finished
+        if progress is not None and progress >= 100:
+            # create excel report
+            filename, error = self._generate_report_for_changed_audio()
+            if error:
+                self.send_thread_error(error)
+                return error
+            # done, let any listening objects/classes know we are finished, pass "audio" in case listeners want
+            # to know what is sending this signal
+            self.finished_tracking.emit(("audio", filename))
 
     def _generate_report_for_changed_audio(self):
         """
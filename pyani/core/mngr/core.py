@@ -1,7 +1,6 @@
 import os
 import logging
 import re
-import mmap
 import time
 from datetime import datetime
 # need to import _strptime for multi-threading, a known python 2.7 bug
@@ -50,17 +49,19 @@ class AniCoreMngr(QtCore.QObject):
     finished_tracking = pyqtSignal(object)
     # error message for other classes to receive when doing any local file operations
     error_thread_signal = pyqtSignal(object)
+    # progress as a percent and an optional label, lets threads report progress without pumping the ui event loop
+    progress_signal = pyqtSignal(int, str)
 
     def __init__(self):
         QtCore.QObject.__init__(self)
 
-        self.app_vars = pyani.core.appvars.AppVars()
+        self.app_vars = pyani.core.appvars.get_app_vars()
         self.ani_vars = pyani.core.anivars.AniVars()
 
         self.thread_pool = QtCore.QThreadPool()
         logger.info("Multi-threading with maximum %d threads" % self.thread_pool.maxThreadCount())
-        self.thread_total = 0.0
-        self.threads_done = 0.0
+        self.thread_total = 0
+        self.threads_done = 0
         self.thread_error_occurred = False
 
         # this allows the ui time to display info about this task. Some tasks/methods run very fast, and never
@@ -71,6 +72,18 @@ class AniCoreMngr(QtCore.QObject):
         # for reporting progress
         self.progress_win = QtWidgets.QProgressDialog()
         self.progress_win.hide()
+        self.progress_signal.connect(self._update_progress)
+        # progress updates are coalesced and pushed to the progress window at most ~30 times a second, many threads
+        # finishing close together otherwise cause a repaint per thread
+        self._pending_progress = None
+        self._pending_progress_label = None
+        self._progress_timer = QtCore.QTimer()
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._pump_progress)
+
+        # parsed update config file and the (modification time, size) it was read at, see _load_update_config_cached
+        self._update_config_data = None
+        self._update_config_stat = None
 
     def set_number_of_concurrent_threads(self, thread_num=None):
         """
@@ -89,8 +102,8 @@ class AniCoreMngr(QtCore.QObject):
         :return:
         """
         # reset threads counters
-        self.thread_total = 0.0
-        self.threads_done = 0.0
+        self.thread_total = 0
+        self.threads_done = 0
 
     def get_preference(self, app, category, pref_name):
         """
@@ -209,20 +222,24 @@ class AniCoreMngr(QtCore.QObject):
         if not setup_dir:
             setup_dir = os.getcwd()
 
-        # find app_bridge, check in setup folder first
-        if self.app_vars.cgt_bridge_api_dir in os.listdir(setup_dir):
-            # remove and recreate tool directory if exists
-            if os.path.exists(self.app_vars.tools_dir):
-                error = pyani.core.util.rm_dir(self.app_vars.tools_dir)
-                if error:
-                    error_fmt = (
-                        "Error occurred deleting existing pyanitools folder. Error is {0}.".format(error)
-                    )
-                    self.send_thread_error(error_fmt)
-                    logger.error(error_fmt)
-                    return error_fmt
+        # looked up once, used in both the setup folder and local lib dir cases
+        tools_dir = self.app_vars.tools_dir
+        bridge_api_path = self.app_vars.cgt_bridge_api_path
+        setup_bridge_api_path = os.path.join(setup_dir, self.app_vars.cgt_bridge_api_dir)
+
+        # find app_bridge, check in setup folder first - a single stat instead of listing the setup folder
+        if os.path.isdir(setup_bridge_api_path):
+            # remove and recreate tool directory, rm_dir does nothing if it doesn't exist
+            error = pyani.core.util.rm_dir(tools_dir)
+            if error:
+                error_fmt = (
+                    "Error occurred deleting existing pyanitools folder. Error is {0}.".format(error)
+                )
+                self.send_thread_error(error_fmt)
+                logger.error(error_fmt)
+                return error_fmt
             # make directories
-            error = pyani.core.util.make_all_dir_in_path(self.app_vars.cgt_bridge_api_path)
+            error = pyani.core.util.make_all_dir_in_path(bridge_api_path)
             if error:
                 error_fmt = (
                     "Error occurred making app bridge folder. Error is {0}.".format(error)
@@ -231,8 +248,7 @@ class AniCoreMngr(QtCore.QObject):
                 logger.error(error_fmt)
                 return error_fmt
             # now copy app_bridge files to pyanitools dir
-            src = os.path.join(setup_dir, self.app_vars.cgt_bridge_api_dir)
-            error = pyani.core.util.copy_files(src, self.app_vars.cgt_bridge_api_path)
+            error = pyani.core.util.copy_files(setup_bridge_api_path, bridge_api_path)
             if error:
                 error_fmt = (
                     "Error occurred copying app bridge files. Error is {0}.".format(error)
@@ -242,10 +258,13 @@ class AniCoreMngr(QtCore.QObject):
                 return error_fmt
 
         # check if app_bridge in local lib dir
-        elif os.path.exists(self.app_vars.cgt_bridge_api_path):
-            # copy to temp dir, so can recopy back.
+        elif os.path.exists(bridge_api_path):
+            # move to temp dir, so can move back. a move is a rename when temp is on the same drive, so the files
+            # aren't copied out and back. make sure the temp dir exists but not the leftover bridge from a past run
             temp_loc = os.path.join(self.app_vars.tools_temp_dir, "temp_app_bridge")
-            error = pyani.core.util.make_all_dir_in_path(temp_loc)
+            error = pyani.core.util.make_all_dir_in_path(self.app_vars.tools_temp_dir)
+            if not error:
+                error = pyani.core.util.rm_dir(temp_loc)
             if error:
                 error_fmt = (
                     "Error occurred making temp app bridge folder for copy. Error is {0}.".format(error)
@@ -253,7 +272,7 @@ class AniCoreMngr(QtCore.QObject):
                 self.send_thread_error(error_fmt)
                 logger.error(error_fmt)
                 return error_fmt
-            error = pyani.core.util.copy_files(self.app_vars.cgt_bridge_api_path, temp_loc)
+            error = pyani.core.util.move_dir(bridge_api_path, temp_loc)
             if error:
                 error_fmt = (
                     "Error occurred copying app bridge files to temp dir. Error is {0}.".format(error)
@@ -261,18 +280,17 @@ class AniCoreMngr(QtCore.QObject):
                 self.send_thread_error(error_fmt)
                 logger.error(error_fmt)
                 return error_fmt
-            # remove and recreate tool directory if exists
-            if os.path.exists(self.app_vars.tools_dir):
-                error = pyani.core.util.rm_dir(self.app_vars.tools_dir)
-                if error:
-                    error_fmt = (
-                        "Error occurred deleting existing pyanitools folder. Error is {0}.".format(error)
-                    )
-                    self.send_thread_error(error_fmt)
-                    logger.error(error_fmt)
-                    return error_fmt
-            # make directories
-            error = pyani.core.util.make_all_dir_in_path(self.app_vars.cgt_bridge_api_path)
+            # remove and recreate tool directory, rm_dir does nothing if it doesn't exist
+            error = pyani.core.util.rm_dir(tools_dir)
+            if error:
+                error_fmt = (
+                    "Error occurred deleting existing pyanitools folder. Error is {0}.".format(error)
+                )
+                self.send_thread_error(error_fmt)
+                logger.error(error_fmt)
+                return error_fmt
+            # make directories, only the parent since the bridge folder is moved back in to place
+            error = pyani.core.util.make_all_dir_in_path(os.path.dirname(bridge_api_path))
             if error:
                 error_fmt = (
                     "Error occurred making app bridge folder. Error is {0}.".format(error)
@@ -280,8 +298,8 @@ class AniCoreMngr(QtCore.QObject):
                 self.send_thread_error(error_fmt)
                 logger.error(error_fmt)
                 return error_fmt
-            # copy back from temp dir
-            error = pyani.core.util.copy_files(temp_loc, self.app_vars.cgt_bridge_api_path)
+            # move back from temp dir
+            error = pyani.core.util.move_dir(temp_loc, bridge_api_path)
             if error:
                 error_fmt = (
                     "Error occurred copying app bridge files in temp dir to pyanitools dir. Error is {0}.".format(error)
@@ -299,13 +317,12 @@ class AniCoreMngr(QtCore.QObject):
             logger.error(error_fmt)
             return error_fmt
 
-        # remove persistent directory
-        if  os.path.exists(self.app_vars.persistent_data_path):
-            error = pyani.core.util.rm_dir(self.app_vars.persistent_data_path)
-            if error:
-                error_fmt = "Could not remove user preferences folder. Error is {0}".format(error)
-                self.send_thread_error(error_fmt)
-                return error_fmt
+        # remove persistent directory, rm_dir does nothing if it doesn't exist
+        error = pyani.core.util.rm_dir(self.app_vars.persistent_data_path)
+        if error:
+            error_fmt = "Could not remove user preferences folder. Error is {0}".format(error)
+            self.send_thread_error(error_fmt)
+            return error_fmt
 
         # wait a short duration, otherwise completes too fast and gui never shows as run. This is purely for user so
         # they can see the task displayed in ui.
@@ -320,18 +337,8 @@ class AniCoreMngr(QtCore.QObject):
         :return: None if no errors and succeeds. error returned as a string. Also fires a signal via
         send_thread_error() when in a multi-threaded mode and can't receive return values
         """
-        # remove if exists
-        if os.path.exists(self.app_vars.pyanitools_desktop_shortcut_path):
-            error = pyani.core.util.delete_file(self.app_vars.pyanitools_desktop_shortcut_path)
-            if error:
-                error_fmt = (
-                    "Error occurred deleting old desktop shortcut. Error is {0}.".format(error)
-                )
-                self.send_thread_error(error_fmt)
-                logger.error(error_fmt)
-                return error_fmt
-
-        # copy the shortcut to desktop
+        # copy the shortcut to desktop, overwrites the old shortcut if it exists so no need to check for and remove
+        # it first
         src = os.path.join(self.app_vars.local_pyanitools_shortcuts_dir, self.app_vars.pyanitools_desktop_shortcut_name)
         error = pyani.core.util.copy_file(src, self.app_vars.pyanitools_desktop_shortcut_path)
         if error:
@@ -359,6 +366,23 @@ class AniCoreMngr(QtCore.QObject):
         # setup nuke modifying .nuke/init.py to check c:\users\{user_name}\.nuke\pyanitools\ (create
         # directory if doesn't exist).
 
+        # skip reading init.py if it hasn't changed since the plugin path was last confirmed in it. The modification
+        # time, size and plugin path are saved after each check, so a single stat is enough when nothing changed
+        init_state = dict()
+        if os.path.exists(self.app_vars.nuke_init_state_file):
+            init_state = pyani.core.util.load_json(self.app_vars.nuke_init_state_file)
+            if not isinstance(init_state, dict):
+                init_state = dict()
+        try:
+            init_stat = os.stat(self.app_vars.nuke_init_file_path)
+            init_key = [init_stat.st_mtime, init_stat.st_size, self.app_vars.custom_plugin_path]
+        except (IOError, OSError):
+            init_key = None
+        if init_key and init_state.get("init.py") == init_key:
+            time.sleep(self.time_to_pause_for_ui)
+            self.finished_signal.emit(None)
+            return None
+
         # first check for .nuke folder in C:Users\username
         if not os.path.exists(self.ani_vars.nuke_user_dir):
             error = pyani.core.util.make_dir(self.ani_vars.nuke_user_dir)
@@ -370,38 +394,33 @@ class AniCoreMngr(QtCore.QObject):
                 logger.error(error_fmt)
                 return error_fmt
 
-        # check for init.py in C:Users\username\.nuke
-        if not os.path.exists(os.path.join(self.ani_vars.nuke_user_dir, "init.py")):
-            error = pyani.core.util.make_file(os.path.join(self.ani_vars.nuke_user_dir, "init.py"))
-            if error:
-                error_fmt = (
-                    "Error occurred creating nuke .init file. Error is {0}.".format(error)
-                )
-                self.send_thread_error(error_fmt)
-                logger.error(error_fmt)
-                return error_fmt
-
-        # update the init.py - only append, don't want to lose existing code added by user
+        # create or update the init.py in C:Users\username\.nuke - only append, don't want to lose existing code
+        # added by user. Opening in append mode creates the file if it doesn't exist, so creating, checking and
+        # appending is one open instead of separate exists, create, stat and open calls
         try:
-            # check if file empty, mmap won't work with empty files
-            if os.stat(self.app_vars.nuke_init_file_path).st_size == 0:
-                with open(self.app_vars.nuke_init_file_path, "w") as init_file:
+            with open(self.app_vars.nuke_init_file_path, "a+") as init_file:
+                init_file.seek(0)
+                init_contents = init_file.read()
+                if self.app_vars.custom_plugin_path not in init_contents:
+                    # windows needs a seek between reading and writing
+                    init_file.seek(0, os.SEEK_END)
                     init_file.write("\n" + self.app_vars.custom_plugin_path + "\n")
-                    init_file.close()
-            else:
-                with open(self.app_vars.nuke_init_file_path, "a+") as init_file:
-                    # use mmap just in case init.py is large, shouldn't be, just a precaution. Otherwise could just
-                    # load into a string - note in python 3 mmap is like bytearray
-                    file_in_mem = mmap.mmap(init_file.fileno(), 0, access=mmap.ACCESS_READ)
-                    if file_in_mem.find(self.app_vars.custom_plugin_path) == -1:
-                        init_file.write("\n" + self.app_vars.custom_plugin_path + "\n")
-                        init_file.close()
         except (IOError, OSError, ValueError) as e:
             error = "Could not open {0}. Received error {1}".format(self.app_vars.nuke_init_file_path, e)
             self.send_thread_error(error)
             logger.error(error)
             return error
 
+        # remember the state of init.py now that it has the plugin path. not being able to save this isn't an error,
+        # init.py just gets read again next time
+        try:
+            init_stat = os.stat(self.app_vars.nuke_init_file_path)
+            init_state["init.py"] = [init_stat.st_mtime, init_stat.st_size, self.app_vars.custom_plugin_path]
+            if os.path.exists(self.app_vars.persistent_data_path):
+                pyani.core.util.write_json(self.app_vars.nuke_init_state_file, init_state)
+        except (IOError, OSError) as e:
+            logger.warning("Could not save nuke init.py state. Received error {0}".format(e))
+
         # wait a short duration, otherwise completes too fast and gui never shows as run. This is purely for user so
         # they can see the task displayed in ui.
         time.sleep(self.time_to_pause_for_ui)
@@ -462,26 +481,17 @@ class AniCoreMngr(QtCore.QObject):
         :return: None if no errors and succeeds. error returned as a string. Also fires a signal via
         send_thread_error() when in a multi-threaded mode and can't receive return values
         """
-        # remove if exists
-        if os.path.exists(self.app_vars.pyanitools_support_launcher_path):
-            error = pyani.core.util.delete_file(self.app_vars.pyanitools_support_launcher_path)
+        # check if persistent dir exists, if not make it
+        if not os.path.exists(self.app_vars.persistent_data_path):
+            error = pyani.core.util.make_dir(self.app_vars.persistent_data_path)
             if error:
-                error_fmt = (
-                    "Error occurred deleting old support launcher. Error is {0}.".format(error)
-                )
+                error_fmt = "Could not create user preferences folder. Error is {0}".format(error)
                 self.send_thread_error(error_fmt)
                 logger.error(error_fmt)
                 return error_fmt
-        # doesn't exist, check if persistent dir exists, if not make it
-        else:
-            if not os.path.exists(self.app_vars.persistent_data_path):
-                error = pyani.core.util.make_dir(self.app_vars.persistent_data_path)
-                if error:
-                    error_fmt = "Could not create user preferences folder. Error is {0}".format(error)
-                    self.send_thread_error(error_fmt)
-                    return error_fmt
 
-        # copy the launcher to persistent data location
+        # copy the launcher to persistent data location, copy overwrites an existing launcher in place so there is
+        # no need to delete it first, and no point where the launcher is missing
         src = os.path.join(self.app_vars.local_pyanitools_core_dir, self.app_vars.pyanitools_support_launcher_name)
         error = pyani.core.util.copy_file(src, self.app_vars.pyanitools_support_launcher_path)
         if error:
@@ -613,8 +623,8 @@ class AniCoreMngr(QtCore.QObject):
         :param asset_subcomponent: the sub component. Optional, only some assets have this, for ex tools
         :return: True if the asset exists, False if not
         """
-        # pull the config data off disk - may have changed so we want the latest
-        existing_config_data = pyani.core.util.load_json(self.app_vars.update_config_file)
+        # get the config data - may have changed on disk so we want the latest, only re-parsed if the file changed
+        existing_config_data = self._load_update_config_cached()
         # make sure file was loaded
         if not isinstance(existing_config_data, dict):
             return False
@@ -631,6 +641,25 @@ class AniCoreMngr(QtCore.QObject):
                         return True
         return False
 
+    def _load_update_config_cached(self):
+        """
+        Loads the update config file, keeping the parsed data in memory. The file is only re-read when its
+        modification time or size changes, so checking many assets doesn't re-parse the json for every asset. The data
+        returned is shared, don't modify it.
+        :return: the config json data or error if can't read the file
+        """
+        try:
+            file_stat = os.stat(self.app_vars.update_config_file)
+        except (IOError, OSError) as e:
+            self._update_config_data = None
+            return "Could not read {0}. Error is {1}".format(self.app_vars.update_config_file, e)
+
+        stat_key = (file_stat.st_mtime, file_stat.st_size)
+        if self._update_config_data is None or stat_key != self._update_config_stat:
+            self._update_config_data = pyani.core.util.load_json(self.app_vars.update_config_file)
+            self._update_config_stat = stat_key
+        return self._update_config_data
+
     def sync_local_cache_with_server(self, update_data_dict=None):
         """
         Updates the cache on disk with the current server data. If no parameters are filled the entire cache will
@@ -929,7 +958,7 @@ class AniCoreMngr(QtCore.QObject):
                     local_file_paths=[local_file_path],
                     update_local_version=False
                 )
-                self.thread_total += 1.0
+                self.thread_total += 1
                 self.thread_pool.start(worker)
 
                 worker.signals.finished.connect(self._thread_server_download_complete)
@@ -1371,9 +1400,18 @@ class AniCoreMngr(QtCore.QObject):
         if not self.thread_error_occurred:
             self.error_thread_signal.emit(error)
             self.thread_error_occurred = True
+            # drop any progress waiting to be shown so the closed window isn't updated, the timer stops itself on
+            # its next tick. may be called from a worker thread so don't touch the timer here
+            self._pending_progress = None
+            self._pending_progress_label = None
             self.progress_win.close()
 
     def init_progress_window(self, title, label):
+        # drop progress still waiting from the previous task, otherwise the timer could show it on this task's
+        # freshly reset window
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self._pending_progress_label = None
         self.progress_win.setWindowTitle(title)
         self.progress_win.setLabelText(label)
         self.progress_win.setValue(0)
@@ -1383,7 +1421,57 @@ class AniCoreMngr(QtCore.QObject):
         # makes sure progress shows over window, as windows os will place it under cursor behind other windows if
         # user moves mouse off off app
         pyani.core.ui.center(self.progress_win)
-        QtWidgets.QApplication.processEvents()
+
+    def _update_progress(self, progress, label):
+        """
+        Slot for progress_signal, stores the progress so the timer can push it to the progress window
+        :param progress: the progress as an integer percent
+        :param label: optional text to display, an empty string leaves the current label
+        """
+        # the end of a task is shown right away rather than through the timer, so nothing from this task is left
+        # pending once its finished signal fires
+        if progress >= 100:
+            self._progress_timer.stop()
+            self._pending_progress = None
+            self._pending_progress_label = None
+            if label:
+                self.progress_win.setLabelText(label)
+            self.progress_win.setValue(progress)
+            return
+        self._pending_progress = progress
+        if label:
+            self._pending_progress_label = label
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _pump_progress(self):
+        """
+        Called by the progress timer, updates the progress window with the latest progress. Stops the timer when
+        there is nothing left to show
+        """
+        if self._pending_progress is None and self._pending_progress_label is None:
+            self._progress_timer.stop()
+            return
+        if self._pending_progress_label is not None:
+            self.progress_win.setLabelText(self._pending_progress_label)
+            self._pending_progress_label = None
+        if self._pending_progress is not None:
+            self.progress_win.setValue(self._pending_progress)
+            self._pending_progress = None
+
+    def _tick_thread_progress(self):
+        """
+        Counts a finished thread and sends the new progress to the progress window
+        :return: the progress percentage as an int, or None if more threads finished than were started
+        """
+        # a thread finished, increment our count
+        self.threads_done += 1
+        if self.threads_done > self.thread_total:
+            return None
+        # get the current progress percentage, integer math so the last thread always lands exactly on 100
+        progress = self.threads_done * 100 // self.thread_total
+        self.progress_signal.emit(progress, "")
+        return progress
 
     def _thread_server_download_complete(self):
         """
@@ -1391,19 +1479,11 @@ class AniCoreMngr(QtCore.QObject):
         """
         # since managers handle, only run for the active tool or asset
         if not self.thread_error_occurred:
-            # a thread finished, increment our count
-            self.threads_done += 1.0
-            if self.threads_done > self.thread_total:
-                return
-            else:
-                # get the current progress percentage
-                progress = (self.threads_done / self.thread_total) * 100.0
-
-                self.progress_win.setValue(progress)
-                # check if we are finished
-                if progress >= 100.0:
-                    # done, let any listening objects/classes know we are finished
-                    self.finished_signal.emit(None)
+            progress = self._tick_thread_progress()
+            # check if we are finished
+            if progress is not None and progress >= 100:
+                # done, let any listening objects/classes know we are finished
+                self.finished_signal.emit(None)
 
     def _thread_server_sync_complete(self, page_id=None, save_method=None):
         """
@@ -1414,24 +1494,16 @@ class AniCoreMngr(QtCore.QObject):
         """
         # since managers handle, only run for the active tool or asset
         if page_id and save_method and not self.thread_error_occurred:
-            # a thread finished, increment our count
-            self.threads_done += 1.0
-            if self.threads_done > self.thread_total:
-                return
-            else:
-                # get the current progress percentage
-                progress = (self.threads_done / self.thread_total) * 100.0
-
-                self.progress_win.setValue(progress)
-                # check if we are finished
-                if progress >= 100.0:
-                    # save the cache locally
-                    error = save_method()
-                    if error:
-                        self.send_thread_error(error)
-                    else:
-                        # done, let any listening objects/classes know we are finished
-                        self.finished_sync_and_download_signal.emit(page_id)
+            progress = self._tick_thread_progress()
+            # check if we are finished
+            if progress is not None and progress >= 100:
+                # save the cache locally
+                error = save_method()
+                if error:
+                    self.send_thread_error(error)
+                else:
+                    # done, let any listening objects/classes know we are finished
+                    self.finished_sync_and_download_signal.emit(page_id)
 
     def _thread_server_cache_complete(self, save_method=None):
         """
@@ -1441,20 +1513,13 @@ class AniCoreMngr(QtCore.QObject):
         """
         # check for a save method and thread errors, otherwise don't execute
         if save_method and not self.thread_error_occurred:
-            # a thread finished, increment our count
-            self.threads_done += 1.0
-            if self.threads_done > self.thread_total:
-                return
-            else:
-                # get the current progress percentage
-                progress = (self.threads_done / self.thread_total) * 100.0
-                self.progress_win.setValue(progress)
-                # check if we are finished
-                if progress >= 100.0:
-                    # save the cache locally
-                    error = save_method()
-                    if error:
-                        self.send_thread_error(error)
-                    else:
-                        # done, let any listening objects/classes know we are finished
-                        self.finished_cache_build_signal.emit(None)
+            progress = self._tick_thread_progress()
+            # check if we are finished
+            if progress is not None and progress >= 100:
+                # save the cache locally
+                error = save_method()
+                if error:
+                    self.send_thread_error(error)
+                else:
+                    # done, let any listening objects/classes know we are finished
+                    self.finished_cache_build_signal.emit(None)
@@ -6,12 +6,15 @@ files with 'test' in them
 import os
 import sys
 import json
+import time
+import tempfile
 import qdarkstyle
 import pyani.core.mngr.core
 import pyani.core.mngr.assets
 import pyani.core.mngr.tools
 import pyani.core.mngr.ui.core
 import pyani.core.util
+import pyani.core.ui
 
 # set the environment variable to use a specific wrapper
 # it can be set to pyqt, pyqt5, pyside or pyside2 (not implemented yet)
@@ -19,7 +22,7 @@ import pyani.core.util
 os.environ['QT_API'] = 'pyqt'
 # import from QtPy instead of doing it directly
 # note that QtPy always uses PyQt5 API
-from qtpy import QtWidgets
+from qtpy import QtWidgets, QtCore
 
 
 class TestTaskListWin:
@@ -51,6 +54,14 @@ class TestWindow(QtWidgets.QDialog):
         self.btn_test_post_task_unit_test = QtWidgets.QPushButton("start test post task unit test")
         self.btn_test_post_task_unit_test.pressed.connect(self.start_post_task_unit_test)
 
+        self.btn_task_list_parallel_error_unit_test = QtWidgets.QPushButton(
+            "start task list parallel error unit test"
+        )
+        self.btn_task_list_parallel_error_unit_test.pressed.connect(self.start_task_list_parallel_error_unit_test)
+
+        self.btn_file_dialog_unit_test = QtWidgets.QPushButton("start file dialog unit test")
+        self.btn_file_dialog_unit_test.pressed.connect(self.start_file_dialog_unit_test)
+
         '''
         -----------------------------------------------------------------------------------------------------------
         '''
@@ -61,6 +72,9 @@ class TestWindow(QtWidgets.QDialog):
         self.btn_create_update_config_unit_test = QtWidgets.QPushButton("start create update config unit test")
         self.btn_create_update_config_unit_test.pressed.connect(self.start_update_config_unit_test)
 
+        self.btn_update_config_cache_unit_test = QtWidgets.QPushButton("start update config cache unit test")
+        self.btn_update_config_cache_unit_test.pressed.connect(self.start_update_config_cache_unit_test)
+
         self.btn_create_seq_list_unit_test = QtWidgets.QPushButton("start create sequence list unit test")
         self.btn_create_seq_list_unit_test.pressed.connect(self.start_seq_list_unit_test)
 
@@ -73,6 +87,9 @@ class TestWindow(QtWidgets.QDialog):
         self.btn_create_customize_nuke_unit_test = QtWidgets.QPushButton("start create customize_nuke unit test")
         self.btn_create_customize_nuke_unit_test.pressed.connect(self.start_customize_nuke_unit_test)
 
+        self.btn_customize_nuke_skip_unit_test = QtWidgets.QPushButton("start customize_nuke unchanged skip unit test")
+        self.btn_customize_nuke_skip_unit_test.pressed.connect(self.start_customize_nuke_skip_unit_test)
+
         self.btn_create_task_sched_unit_test = QtWidgets.QPushButton("start create windows task sched unit test")
         self.btn_create_task_sched_unit_test.pressed.connect(self.start_create_task_sched_unit_test)
 
@@ -145,13 +162,17 @@ class TestWindow(QtWidgets.QDialog):
         layout = QtWidgets.QVBoxLayout()
         layout.addWidget(QtWidgets.QLabel("<b>Misc Unit Tests</b>"))
         layout.addWidget(self.btn_test_post_task_unit_test)
+        layout.addWidget(self.btn_task_list_parallel_error_unit_test)
+        layout.addWidget(self.btn_file_dialog_unit_test)
         layout.addWidget(QtWidgets.QLabel("<b>Setup/Update Unit Tests</b>"))
         layout.addWidget(self.btn_create_setup_dependencies_unit_test)
         layout.addWidget(self.btn_create_update_config_unit_test)
+        layout.addWidget(self.btn_update_config_cache_unit_test)
         layout.addWidget(self.btn_create_seq_list_unit_test)
         layout.addWidget(self.btn_create_launcher_unit_test)
         layout.addWidget(self.btn_create_desktop_shortcut_unit_test)
         layout.addWidget(self.btn_create_customize_nuke_unit_test)
+        layout.addWidget(self.btn_customize_nuke_skip_unit_test)
         layout.addWidget(self.btn_create_task_sched_unit_test)
 
         layout.addWidget(QtWidgets.QLabel("<b>Asset and Tool Unit Tests</b>"))
@@ -225,6 +246,79 @@ class TestWindow(QtWidgets.QDialog):
         test_win = TestTaskListWin()
         test_win.run(post_tasks)
 
+    def start_task_list_parallel_error_unit_test(self):
+        """
+        Runs a task list with a 'run parallel' task that fails while two sequential tasks run. The error stops the
+        task list, and the post task must run exactly once, after the running sequential task finishes
+        """
+        self.task_list_test_post_task_runs = 0
+        self.task_list_test_seq_tasks_done = []
+
+        def fake_parallel_task():
+            raise ValueError("fake parallel task failed")
+
+        def fake_seq_task(name):
+            # long enough that the parallel task fails while this is still running
+            time.sleep(0.5)
+            self.task_list_test_seq_tasks_done.append(name)
+
+        def post_task():
+            self.task_list_test_post_task_runs += 1
+            # the sequential task running when the error happened must have finished first
+            print "post task run {0}, sequential tasks done: {1}".format(
+                self.task_list_test_post_task_runs, self.task_list_test_seq_tasks_done
+            )
+
+        def task(func, params, parallel=False):
+            return {
+                'func': func,
+                'params': params,
+                'finish signal': None,
+                'error signal': None,
+                'thread task': True,
+                'desc': func.__name__,
+                'run parallel': parallel
+            }
+
+        self.task_list_test = pyani.core.mngr.ui.core.AniTaskList(
+            [
+                task(fake_parallel_task, [], parallel=True),
+                task(fake_seq_task, ["seq 1"]),
+                task(fake_seq_task, ["seq 2"])
+            ],
+            error_callback=lambda error: self.task_list_test.stop_tasks(),
+            post_tasks_to_run=[{'func': post_task, 'params': []}]
+        )
+        self.task_list_test.start_tasks()
+        # check once everything has had time to finish
+        QtCore.QTimer.singleShot(2000, self._check_task_list_parallel_error_unit_test)
+
+    def _check_task_list_parallel_error_unit_test(self):
+        if self.task_list_test_post_task_runs == 1 and self.task_list_test_seq_tasks_done == ["seq 1"]:
+            print "task list parallel error unit test passed."
+        else:
+            print "task list parallel error unit test FAILED. post task runs: {0}, sequential tasks done: {1}".format(
+                self.task_list_test_post_task_runs, self.task_list_test_seq_tasks_done
+            )
+
+    def start_file_dialog_unit_test(self):
+        """
+        Builds a FileDialog without showing it. Checks it uses the generic icon provider and that the provider hands
+        out the same folder and file icons for every entry
+        """
+        dialog = pyani.core.ui.FileDialog()
+        icon_provider = dialog.iconProvider()
+        folder_info = QtCore.QFileInfo(os.path.expanduser("~"))
+        file_info = QtCore.QFileInfo(os.path.abspath(__file__))
+        if not isinstance(icon_provider, pyani.core.ui.FileDialogIconProvider):
+            print "file dialog unit test FAILED. icon provider is {0}".format(type(icon_provider).__name__)
+        elif icon_provider.icon(folder_info).cacheKey() != icon_provider.icon(folder_info).cacheKey() or \
+                icon_provider.icon(file_info).cacheKey() != icon_provider.icon(file_info).cacheKey():
+            print "file dialog unit test FAILED. icon provider made new icons for the same entry"
+        else:
+            print "file dialog unit test passed."
+        dialog.deleteLater()
+
     def start_create_setup_dependencies_unit_test(self):
         self.core_mngr.create_setup_dependencies(setup_dir="C:\\Users\\Patrick\\Downloads\\install\\")
 
@@ -240,12 +334,90 @@ class TestWindow(QtWidgets.QDialog):
     def start_customize_nuke_unit_test(self):
         self.core_mngr.customize_nuke()
 
+    def start_customize_nuke_skip_unit_test(self):
+        """
+        Runs customize_nuke twice. The first run adds the plugin path if needed and saves the state of init.py, the
+        second run must see init.py is unchanged and skip opening it
+        """
+        init_path = self.core_mngr.app_vars.nuke_init_file_path
+        error = self.core_mngr.customize_nuke()
+        if error:
+            print "customize_nuke skip unit test FAILED. first run error: {0}".format(error)
+            return
+
+        init_state = pyani.core.util.load_json(self.core_mngr.app_vars.nuke_init_state_file)
+        init_stat = os.stat(init_path)
+        expected_key = [init_stat.st_mtime, init_stat.st_size, self.core_mngr.app_vars.custom_plugin_path]
+        if not isinstance(init_state, dict) or init_state.get("init.py") != expected_key:
+            print "customize_nuke skip unit test FAILED. state saved: {0}, expected: {1}".format(
+                init_state, expected_key
+            )
+            return
+
+        # count how many times init.py is opened on the second run, the module global shadows the builtin open
+        init_opens = []
+
+        def counting_open(path, *args, **kwargs):
+            if path == init_path:
+                init_opens.append(path)
+            return open(path, *args, **kwargs)
+
+        pyani.core.mngr.core.open = counting_open
+        try:
+            error = self.core_mngr.customize_nuke()
+        finally:
+            del pyani.core.mngr.core.open
+
+        if error or init_opens or os.stat(init_path).st_mtime != init_stat.st_mtime:
+            print "customize_nuke skip unit test FAILED. error: {0}, times init.py opened: {1}".format(
+                error, len(init_opens)
+            )
+        else:
+            print "customize_nuke skip unit test passed."
+
     def start_seq_list_unit_test(self):
         self.core_mngr.create_sequence_list()
 
     def start_update_config_unit_test(self):
         self.core_mngr.create_update_config_file()
 
+    def start_update_config_cache_unit_test(self):
+        """
+        Checks the update config is only parsed again when the file changes. Uses a temporary config file so the
+        user's update config isn't touched
+        """
+        config_handle, config_path = tempfile.mkstemp(suffix=".json")
+        os.close(config_handle)
+        orig_config_path = self.core_mngr.app_vars.update_config_file
+        self.core_mngr.app_vars.update_config_file = config_path
+        try:
+            pyani.core.util.write_json(config_path, {"tools": {"maya": ["tool_a"]}})
+            found_a = self.core_mngr.is_asset_in_update_config("tools", "maya", "tool_a")
+            found_b = self.core_mngr.is_asset_in_update_config("tools", "maya", "tool_b")
+            cached_data = self.core_mngr._update_config_data
+            # unchanged file, the parsed data is reused
+            self.core_mngr.is_asset_in_update_config("tools", "maya", "tool_a")
+            reused = self.core_mngr._update_config_data is cached_data
+
+            # change the file and move its modification time forward, in case the change lands in the same second
+            pyani.core.util.write_json(config_path, {"tools": {"maya": ["tool_a", "tool_b"]}})
+            config_mtime = os.stat(config_path).st_mtime + 10
+            os.utime(config_path, (config_mtime, config_mtime))
+            found_b_after_change = self.core_mngr.is_asset_in_update_config("tools", "maya", "tool_b")
+        finally:
+            self.core_mngr.app_vars.update_config_file = orig_config_path
+            self.core_mngr._update_config_data = None
+            self.core_mngr._update_config_stat = None
+            os.remove(config_path)
+
+        if found_a and not found_b and reused and found_b_after_change:
+            print "update config cache unit test passed."
+        else:
+            print "update config cache unit test FAILED. found tool_a: {0}, found tool_b before change: {1}, " \
+                  "cache reused: {2}, found tool_b after change: {3}".format(
+                      found_a, found_b, reused, found_b_after_change
+                  )
+
     def start_build_cache_unit_test(self):
         # look for finished message
         self.asset_mngr.sync_local_cache_with_server()
@@ -20,6 +20,25 @@ from qtpy import QtCore, QtGui
 
 logger = logging.getLogger()
 
+# shared http session, see _get_http_session()
+_http_session = None
+
+
+def _get_http_session():
+    """
+    Returns a requests session shared by all tool managers, created on first use. Reusing the session keeps the
+    connection to the wiki server alive between requests instead of a new connection and handshake per request
+    :return: a requests.Session object
+    """
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        # mount once, all requests go to the same host so a small pool is enough
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=3)
+        _http_session.mount("http://", adapter)
+        _http_session.mount("https://", adapter)
+    return _http_session
+
 
 class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
 
@@ -122,6 +141,8 @@ class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
         }
         '''
         self._tools_timestamp_before_dl = dict()
+        # max number of files a single download thread gets from cgt in one call, see server_download()
+        self.files_per_download_thread = 10
 
     @property
     def active_type(self):
@@ -154,7 +175,7 @@ class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
         try:
             url = r"http://172.18.10.11:8090/display/KB/{0}".format(tool_name)
             # check if page exists
-            response = requests.get(
+            response = _get_http_session().get(
                 url,
                 headers={'Content-Type': 'application/json'},
                 auth=(self.app_vars.wiki_user, self.app_vars.wiki_pass)
@@ -672,45 +693,54 @@ class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
         cgt_file_paths = list()
         local_file_paths = list()
 
+        metadata_filename = self.app_vars.cgt_metadata_filename
+
         # now use multi-threading to download
         for tool_type in tools_dict:
             for tool_category in tools_dict[tool_type]:
                 # need to download the cgt metadata as well - once per category
-                files_to_download = [self.app_vars.cgt_metadata_filename]
+                files_to_download = [metadata_filename]
                 for tool_name in tools_dict[tool_type][tool_category]:
+                    # server and local paths of the tool's files, downloaded in batches once all paths are known
+                    tool_cgt_paths = list()
+                    tool_local_paths = list()
+                    # pick where paths go once per tool instead of checking debug for every file. in debug mode paths
+                    # are only collected for display, so the tool lists stay empty and nothing gets downloaded
+                    if debug:
+                        add_cgt_path = cgt_file_paths.append
+                        add_local_path = local_file_paths.append
+                    else:
+                        add_cgt_path = tool_cgt_paths.append
+                        add_local_path = tool_local_paths.append
+                    # look up the tool's info and paths once, they are the same for every file of the tool
+                    tool_info = self._tools_info[tool_type][tool_category][tool_name]
+                    tool_local_dir = tool_info["local path"]
+                    cloud_dir = self.app_vars.tool_types[tool_type][tool_category]['cgt cloud dir']
+                    tool_is_dir = tool_info['is dir']
+                    if tool_is_dir:
+                        on_local_server = self.is_file_on_local_server_representation(cloud_dir, tool_local_dir)
+                    # get timestamps of tools being downloaded - create keys if needed
+                    tool_timestamps = self._tools_timestamp_before_dl.setdefault(tool_type, dict()).setdefault(
+                        tool_category, dict()
+                    ).setdefault(tool_name, dict())
                     # some tools are folders, some are multiple files, so get folder or files
-                    files_to_download.extend(
-                        [
-                            file_name for file_name in self._tools_info[tool_type][tool_category][tool_name]["files"]
-                        ]
-                    )
+                    files_to_download.extend(tool_info["files"])
 
                     for file_name in files_to_download:
-                        # make path in cloud - dirs and files already have full path. metadata does not so make full
-                        # file name for cgt metadata
-                        if self.app_vars.cgt_metadata_filename in file_name:
-                            cgt_path = "{0}/{1}".format(
-                                self._tools_info[tool_type][tool_category][tool_name]["cgt cloud dir"],
-                                file_name
-                            )
-                        else:
-                            cgt_path = file_name
-
-                        # make download path - this is the root directory holding the files or folder downloaded above
+                        # make download path - this is the root directory holding the files or folder downloaded
                         # if its a folder need to add that to the end of the download path, otherwise its a flat
                         # structure so no need. also check for the cgt metadata, that is always beneath the tool type,
                         # ie the root directory for the tool's type, such as script or plugin
 
-                        # server metadata
-                        if self.app_vars.cgt_metadata_filename in file_name:
-                            local_path = self._tools_info[tool_type][tool_category][tool_name]["local path"]
+                        # server metadata - dirs and files already have full path in cloud. metadata does not so
+                        # make full file name for cgt metadata
+                        if metadata_filename in file_name:
+                            cgt_path = "{0}/{1}".format(tool_info["cgt cloud dir"], file_name)
+                            local_path = tool_local_dir
                         # tools in their own folder
-                        elif self._tools_info[tool_type][tool_category][tool_name]['is dir']:
-                            # get local tool directory from server cache
-                            tool_local_dir = self._tools_info[tool_type][tool_category][tool_name]["local path"]
-                            cloud_dir = self.app_vars.tool_types[tool_type][tool_category]['cgt cloud dir']
-
-                            if self.is_file_on_local_server_representation(cloud_dir, tool_local_dir):
+                        elif tool_is_dir:
+                            cgt_path = file_name
+                            if on_local_server:
                                 local_path = self.convert_server_path_to_local_server_representation(
                                     file_name,
                                     directory_only=True
@@ -724,52 +754,48 @@ class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
                                 )
                         # single dir structure - all tools in same dir
                         else:
-                            local_path = self._tools_info[tool_type][tool_category][tool_name]["local path"]
-
-                        # get timestamps of tools being downloaded - create keys if needed
-                        if tool_type not in self._tools_timestamp_before_dl:
-                            self._tools_timestamp_before_dl[tool_type] = dict()
-                        if tool_category not in self._tools_timestamp_before_dl[tool_type]:
-                            self._tools_timestamp_before_dl[tool_type][tool_category] = dict()
-                        if tool_name not in self._tools_timestamp_before_dl[tool_type][tool_category]:
-                            self._tools_timestamp_before_dl[tool_type][tool_category][tool_name] = dict()
+                            cgt_path = file_name
+                            local_path = tool_local_dir
+
                         file_path = "{0}\\{1}".format(local_path, file_name.split("/")[-1])
                         # file may not be on local machine, so try to get time, if can't set to 0
                         try:
-                            self._tools_timestamp_before_dl[tool_type][tool_category][tool_name][file_path] = os.path.getmtime(file_path)
+                            tool_timestamps[file_path] = os.path.getmtime(file_path)
                         except WindowsError:
-                            self._tools_timestamp_before_dl[tool_type][tool_category][tool_name][file_path] = 0.0
+                            tool_timestamps[file_path] = 0.0
 
-                        if debug:
-                            cgt_file_paths.append(cgt_path)
-                            local_file_paths.append(local_path)
-                        else:
-                            # server_file_download expects a list of files, so pass list even though just one file
-                            worker = pyani.core.ui.Worker(
-                                self.server_file_download,
-                                False,
-                                [cgt_path],
-                                local_file_paths=[local_path]
-                            )
-                            self.thread_total += 1.0
-                            self.thread_pool.start(worker)
-
-                            # slot that is called when a thread finishes
-                            if gui_mode:
-                                # passes the active_type so calling classes can know what was updated
-                                # and the save cache method so that when cache gets updated it can be saved
-                                worker.signals.finished.connect(
-                                    functools.partial(
-                                        self._thread_server_sync_complete,
-                                        self.active_type,
-                                        self.server_save_local_cache
-                                    )
-                                )
-                            else:
-                                worker.signals.finished.connect(self._thread_server_download_complete)
-                            worker.signals.error.connect(self.send_thread_error)
+                        add_cgt_path(cgt_path)
+                        add_local_path(local_path)
                         # reset list
                         files_to_download = list()
+
+                    # download the tool's files in batches, each thread downloads a batch with one call to cgt
+                    # instead of one call per file. Tools with many files still get spread across threads
+                    for batch_start in xrange(0, len(tool_cgt_paths), self.files_per_download_thread):
+                        batch_end = batch_start + self.files_per_download_thread
+                        worker = pyani.core.ui.Worker(
+                            self.server_file_download,
+                            False,
+                            tool_cgt_paths[batch_start:batch_end],
+                            local_file_paths=tool_local_paths[batch_start:batch_end]
+                        )
+                        self.thread_total += 1
+
+                        # slot that is called when a thread finishes
+                        if gui_mode:
+                            # passes the active_type so calling classes can know what was updated
+                            # and the save cache method so that when cache gets updated it can be saved
+                            worker.signals.finished.connect(
+                                functools.partial(
+                                    self._thread_server_sync_complete,
+                                    self.active_type,
+                                    self.server_save_local_cache
+                                )
+                            )
+                        else:
+                            worker.signals.finished.connect(self._thread_server_download_complete)
+                        worker.signals.error.connect(self.send_thread_error)
+                        self.thread_pool.start(worker)
         if debug:
             self.progress_win.setValue(100)
             tools_file_paths_dict = {
@@ -858,7 +884,7 @@ class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
                     tool_category,
                     tool_names_to_update=tool_names
                 )
-                self.thread_total += 1.0
+                self.thread_total += 1
                 self.thread_pool.start(worker)
 
                 # slot that is called when a thread finishes, pass the call back function to call when its done
@@ -1125,9 +1151,10 @@ class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
         """
         # a list of files that can't be removed
         errors_removing_files = list()
-        # local and server files
-        local_file_paths = list()
-        server_files = list()
+        # local and server files, sets since they are only used for membership tests. a tool's local directory can
+        # be shared with other tools, so sets also remove duplicate local files
+        local_file_paths = set()
+        server_files = set()
         # list of files removed
         files_removed = list()
 
@@ -1138,6 +1165,9 @@ class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
                 self.send_thread_error("Could not load local tools cache. Error is {0}".format(error))
                 return "Could not load local tools cache. Error is {0}".format(error)
 
+        # local directories already walked
+        local_dirs_walked = set()
+
         # build list of all server paths and all local files for all tools
         for tool_type in self._tools_info:
             for tool_category in self._tools_info[tool_type]:
@@ -1150,26 +1180,24 @@ class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
                     # paths are the same for local and server, so putting files in Z:\.....
                     if self.is_file_on_local_server_representation(cloud_dir, tool_local_dir):
                         # convert server paths in server cache to local paths
-                        server_files.extend(
+                        server_files.update(
                             self.convert_server_path_to_local_server_representation(path)
                             for path in self._tools_info[tool_type][tool_category][tool_name]["files"]
                         )
                     # paths aren't the same for local and server - i.e. not putting files in Z:\....
                     else:
-                        for path in self._tools_info[tool_type][tool_category][tool_name]["files"]:
-                            server_files.append(self.convert_server_path_to_non_local_server(
-                                    cloud_dir,
-                                    tool_local_dir,
-                                    path
-                                )
-                            )
+                        server_files.update(
+                            self.convert_server_path_to_non_local_server(cloud_dir, tool_local_dir, path)
+                            for path in self._tools_info[tool_type][tool_category][tool_name]["files"]
+                        )
 
-                    # get local files
+                    # get local files, only walk each local directory once, tools in a flat structure like plugins
+                    # share the same directory
+                    if tool_local_dir in local_dirs_walked:
+                        continue
+                    local_dirs_walked.add(tool_local_dir)
                     for path, directories, files in scandir.walk(tool_local_dir):
-                        for file_name in files:
-                            local_file_path = os.path.join(path, file_name)
-                            if local_file_path not in local_file_paths:
-                                local_file_paths.append(local_file_path)
+                        local_file_paths.update(os.path.join(path, file_name) for file_name in files)
 
         # remove any files not on server but present locally
         for file_path in local_file_paths:
@@ -1220,5 +1248,5 @@ class AniToolsMngr(pyani.core.mngr.core.AniCoreMngr):
 
     def _reset_thread_counters(self):
         # reset threads counters
-        self.thread_total = 0.0
-        self.threads_done = 0.0
+        self.thread_total = 0
+        self.threads_done = 0
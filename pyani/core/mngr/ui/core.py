@@ -4,6 +4,7 @@ import pyani.core.ui
 import pyani.core.mngr.tools
 import pyani.core.appvars
 import collections
+import StringIO
 
 # set the environment variable to use a specific wrapper
 # it can be set to pyqt, pyqt5, pyside or pyside2 (not implemented yet)
@@ -11,7 +12,7 @@ import collections
 os.environ['QT_API'] = 'pyqt'
 # import from QtPy instead of doing it directly
 # note that QtPy always uses PyQt5 API
-from qtpy import QtWidgets, QtCore
+from qtpy import QtWidgets, QtCore, QtGui
 from PyQt4.QtCore import pyqtSignal
 
 logger = logging.getLogger()
@@ -64,6 +65,12 @@ class AniTaskList:
                 'thread task': True means put task in thread, False does not. Only thread non threaded methods. If
                                the method in 'func' creates threads, set this to False otherwise errors will occur.
                 'desc': string description describing what this method does. shown in activity log.
+                'run parallel': optional, True means the task is started in a thread and the next task starts right
+                                away instead of waiting for it to finish. Only for thread tasks that don't depend on
+                                the tasks after them. Post tasks wait for parallel tasks to finish. Defaults to False
+                'wait for parallel': optional, True means the task doesn't start until all tasks started with
+                                     'run parallel' finish. Use for tasks that depend on a parallel task's output.
+                                     Defaults to False
             }
         :param post_tasks_to_run: optional task(s) to call when main task(s) finish. a list of dicts in format:
             {
@@ -75,8 +82,9 @@ class AniTaskList:
         :param error_callback: optional error callback/function for when errors occur
         :param ui_callback: optional ui callback to update a ui
         """
-        # setup threading
-        self._thread_pool = QtCore.QThreadPool()
+        # setup threading - tasks run on qt's global pool so its threads are reused across task lists instead of
+        # every task list creating and tearing down its own
+        self._thread_pool = QtCore.QThreadPool.globalInstance()
         logger.info("Multi-threading with maximum %d threads" % self._thread_pool.maxThreadCount())
 
         # this tells the next_step_in_task_list() method to not get any more tasks from the task list defined by
@@ -96,6 +104,14 @@ class AniTaskList:
 
         # tasks to run after the main task list runs
         self._post_tasks = post_tasks_to_run
+        # number of tasks started with 'run parallel' that haven't finished yet
+        self._parallel_tasks_running = 0
+        # True when the next task is waiting on parallel tasks to finish before it can start
+        self._waiting_on_parallel = False
+        # True while a task that isn't 'run parallel' is running, the task list continues when it finishes
+        self._sequential_task_running = False
+        # True once the post task(s) ran, they only run once per task list run
+        self._post_tasks_run = False
 
     def set_error_method(self, func):
         """Set the error callback function when errors occur"""
@@ -121,6 +137,7 @@ class AniTaskList:
 
     def start_tasks(self):
         """Starts the task list by getting first task"""
+        self._post_tasks_run = False
         self._get_next_task_to_run()
 
     def is_task_remaining(self):
@@ -135,18 +152,48 @@ class AniTaskList:
         Increments to the next step in the update or setup process task list, provided via the class variable
         task_list. If no more tasks are left, shows the activity report and hides step and progress ui labels
         """
+        # called when a sequential task finishes, or right after a parallel task starts when none is running
+        self._sequential_task_running = False
         # check for more steps that need to be run
         if self._task_list and not self._stop_tasks:
+            # next task needs the output of tasks still running in parallel, resumes when they finish
+            if self._parallel_tasks_running and self._task_list[0].get('wait for parallel', False):
+                self._waiting_on_parallel = True
+                return
             # add to activity log as success
             self._get_next_task_to_run()
-        # no more steps
-        else:
-            # run the post task(s)
-            if self._post_tasks:
-                for task in self._post_tasks:
-                    func = task['func']
-                    params = task['params']
-                    func(*params)
+        # no more steps, run the post task(s) once any tasks running in parallel finish
+        elif not self._parallel_tasks_running:
+            self._run_post_tasks()
+
+    def _parallel_task_finished(self):
+        """
+        Called when a task started with 'run parallel' finishes. When none are left running, starts a task that
+        was waiting on them, or runs the post task(s) if the task list is done
+        """
+        self._parallel_tasks_running -= 1
+        if self._parallel_tasks_running:
+            return
+        if self._waiting_on_parallel:
+            self._waiting_on_parallel = False
+            self.next_step_in_task_list()
+        # a sequential task still running calls next_step_in_task_list when it finishes, which runs the post tasks
+        elif (not self._task_list or self._stop_tasks) and not self._sequential_task_running:
+            self._run_post_tasks()
+
+    def _run_post_tasks(self):
+        """
+        Runs the post task(s) if there are any. Only runs them once, even if both the last sequential task and the
+        last parallel task report finishing
+        """
+        if self._post_tasks_run:
+            return
+        self._post_tasks_run = True
+        if self._post_tasks:
+            for task in self._post_tasks:
+                func = task['func']
+                params = task['params']
+                func(*params)
 
     def _get_next_task_to_run(self):
         """
@@ -173,16 +220,25 @@ class AniTaskList:
                     *self._method_params
                 )
 
-                self._thread_pool.start(worker)
-                # slot that is called when a thread finishes, passes the active_type so calling classes can
-                # know what was updated and the save cache method so that when cache gets updated it can be
-                # saved
-                worker.signals.finished.connect(self.next_step_in_task_list)
                 if self._error_callback:
                     worker.signals.error.connect(self._error_callback)
+                # task doesn't need to finish before the next one starts, so overlap it with the remaining tasks
+                if task_list_package.get('run parallel', False):
+                    self._parallel_tasks_running += 1
+                    worker.signals.finished.connect(self._parallel_task_finished)
+                    self._thread_pool.start(worker)
+                    self.next_step_in_task_list()
+                else:
+                    # slot that is called when a thread finishes, passes the active_type so calling classes can
+                    # know what was updated and the save cache method so that when cache gets updated it can be
+                    # saved
+                    worker.signals.finished.connect(self.next_step_in_task_list)
+                    self._sequential_task_running = True
+                    self._thread_pool.start(worker)
             # already threaded, don't thread
             else:
                 self._method_finish_signal.connect(self.next_step_in_task_list)
+                self._sequential_task_running = True
                 if self._error_callback:
                     self._method_error_signal.connect(self._error_callback)
                 self._method_to_run(*self._method_params)
@@ -309,8 +365,30 @@ class AniTaskListWindow(pyani.core.ui.AniQMainWindow):
             self.step_total = len(self.progress_list)
         else:
             self.step_total = 0
-        # logs what runs successfully and errors
-        self.activity_log = []
+        # label html for update_ui, the font and step total don't change so only the step number and the
+        # step description are filled in per step. Braces that stay after this format are doubled
+        self._step_label_template = (
+            "<p align='center'>"
+            "<font style='font-size:10pt; font-family:{0}; color: #ffffff;'>S T E P</font><br>"
+            "<font style='font-size:20pt; font-family:{0}; color: #ffffff;'>{{0}} / {1}</font>"
+            "</p>".format(
+                self.font_family,
+                self.step_total
+            )
+        )
+        self._progress_label_template = (
+            "<span style='font-size:{0}pt; font-family:{1}; color: #ffffff;'>{{0}}</span>".format(
+                self.font_size,
+                self.font_family
+            )
+        )
+        # logs what runs successfully and errors, items are written as html list items to one buffer
+        self.activity_log = StringIO.StringIO()
+        # the activity report is built when a run starts and items are streamed into it as they're logged. The cursor
+        # stays at the end of the report's list, the header block holds the success message once the report shows
+        self._activity_cursor = None
+        self._activity_list = None
+        self._activity_header_block = None
         # shown at end as a description of what ran
         self.task_desc = None
 
@@ -331,6 +409,7 @@ class AniTaskListWindow(pyani.core.ui.AniQMainWindow):
         self.activity_report = QtWidgets.QTextEdit("")
         self.activity_report.setFixedWidth(400)
         self.activity_report.setFixedHeight(350)
+        self._build_activity_report()
 
         # hide at start, shown when all tasks done
         self.activity_report.hide()
@@ -415,6 +494,10 @@ class AniTaskListWindow(pyani.core.ui.AniQMainWindow):
         """
         Starts running the first task/method in the task list provided via the class variable task_list
         """
+        # a new run starts with an empty activity log and report
+        self.activity_log = StringIO.StringIO()
+        self.error_occurred = False
+        self._build_activity_report()
         # run the first task
         self.task_mngr.start_tasks()
 
@@ -424,23 +507,8 @@ class AniTaskListWindow(pyani.core.ui.AniQMainWindow):
         """
         if self.progress_list:
             self.step_num += 1
-            self.step_label.setText(
-                "<p align='center'>"
-                "<font style='font-size:10pt; font-family:{0}; color: #ffffff;'>S T E P</font><br>"
-                "<font style='font-size:20pt; font-family:{0}; color: #ffffff;'>{1} / {2}</font>"
-                "</p>".format(
-                    self.font_family,
-                    self.step_num,
-                    self.step_total
-                )
-            )
-            self.progress_label.setText(
-                "<span style='font-size:{0}pt; font-family:{1}; color: #ffffff;'>{2}</span>".format(
-                    self.font_size,
-                    self.font_family,
-                    self.progress_list.pop(0)
-                )
-            )
+            self.step_label.setText(self._step_label_template.format(self.step_num))
+            self.progress_label.setText(self._progress_label_template.format(self.progress_list.pop(0)))
 
     def process_error(self, error):
         """
@@ -454,7 +522,7 @@ class AniTaskListWindow(pyani.core.ui.AniQMainWindow):
             " The error is:</br> {4}</span>"
             .format(
                 self.font_family,
-                pyani.core.ui.RED.name(),
+                pyani.core.ui.RED_NAME,
                 self.font_size,
                 self.progress_label.text(),
                 error
@@ -462,20 +530,29 @@ class AniTaskListWindow(pyani.core.ui.AniQMainWindow):
         )
         self.task_mngr.stop_tasks()
         self.error_occurred = True
-        self.activity_log.append(error_msg)
+        self.add_activity_log_item(error_msg)
         logger.error(error_msg)
         self.display_activity_log()
 
     def add_activity_log_item(self, item):
         """
-        Adds a new item to the log
+        Adds a new item to the log and streams it into the activity report
         :param item: a string item, can contain html formatting
         """
-        self.activity_log.append(item)
+        self.activity_log.write("<li>{0}</li>".format(item))
+        # the first item starts the report's list, later items are new blocks in it
+        if self._activity_list is None:
+            self._activity_list = self._activity_cursor.insertList(QtGui.QTextListFormat.ListDisc)
+        else:
+            self._activity_cursor.insertBlock()
+        self._activity_cursor.insertHtml(
+            "<font style='font-size:10pt; font-family:{0}; color: #ffffff;'>{1}</font>".format(self.font_family, item)
+        )
 
     def display_activity_log(self):
         """
-        Show the activity (i.e. install or update steps) that ran or failed
+        Show the activity (i.e. install or update steps) that ran or failed. Items are already in the report, so
+        only the header is set, saying the setup succeeded unless an error occurred
         """
         if not self.error_occurred:
             success_msg = "<span style='font-size:10pt; font-family:{0}; color: {1};'><strong>" \
@@ -486,17 +563,29 @@ class AniTaskListWindow(pyani.core.ui.AniQMainWindow):
         else:
             success_msg = ""
 
+        # replace whatever the header block holds, it's above the list so the list cursor isn't affected
+        header_cursor = QtGui.QTextCursor(self._activity_header_block)
+        header_cursor.movePosition(QtGui.QTextCursor.EndOfBlock, QtGui.QTextCursor.KeepAnchor)
+        header_cursor.removeSelectedText()
+        if success_msg:
+            header_cursor.insertHtml(success_msg)
+        self.activity_report.show()
+
+    def _build_activity_report(self):
+        """
+        Clears the activity report down to its title and an empty header block, with the cursor at the end ready
+        for add_activity_log_item to start the list
+        """
         self.activity_report.setText(
-            "<span style='font-size:18pt; font-family:{0}; color: #ffffff;'>ACTIVITY LOG <br><br></span>{1}"
-            "<font style='font-size:10pt; font-family:{0}; color: #ffffff;'>"
-            "<ul><li>{2}</ul>"
-            "</font>".format(
-                self.font_family,
-                success_msg,
-                '<li>'.join(self.activity_log)
+            "<span style='font-size:18pt; font-family:{0}; color: #ffffff;'>ACTIVITY LOG <br><br></span>".format(
+                self.font_family
             )
         )
-        self.activity_report.show()
+        self._activity_cursor = self.activity_report.textCursor()
+        self._activity_cursor.movePosition(QtGui.QTextCursor.End)
+        self._activity_cursor.insertBlock()
+        self._activity_header_block = self._activity_cursor.block()
+        self._activity_list = None
 
 
 class AniReportCore(QtWidgets.QDialog):
@@ -514,7 +603,7 @@ class AniReportCore(QtWidgets.QDialog):
         """
         super(AniReportCore, self).__init__(parent=parent_win)
 
-        self.app_vars = pyani.core.appvars.AppVars()
+        self.app_vars = pyani.core.appvars.get_app_vars()
 
         # font styling
         self.font_family = pyani.core.ui.FONT_FAMILY
@@ -646,7 +735,7 @@ class AniAssetUpdateReport(AniReportCore):
         """
         super(AniAssetUpdateReport, self).__init__(parent_win, "Asset Update Report")
 
-        self.app_vars = pyani.core.appvars.AppVars()
+        self.app_vars = pyani.core.appvars.get_app_vars()
 
         # dictionary for displaying the assets by category in the following order:
         # rigs, audio, gpu cache, maya tools then pyanitools
@@ -884,7 +973,7 @@ class AniAssetUpdateReport(AniReportCore):
                     if asset_info['files removed']:
                         html_report += "<ul>" \
                                        "<li><span style='color:{0};'>REMOVED:<span></li>".format(
-                                            pyani.core.ui.RED.name()
+                                            pyani.core.ui.RED_NAME
                                         )
                         html_report += "<ul>"
                         # add files that were added, modified or removed
@@ -111,6 +111,12 @@ class CoreTab(QtWidgets.QWidget):
         self.additional_options_menu = QtWidgets.QComboBox()
 
         self.tree = None
+        # rebuilding the tree waits a moment so back to back refresh requests (like several syncs finishing
+        # together) only rebuild it once
+        self.tree_refresh_timer = QtCore.QTimer(self)
+        self.tree_refresh_timer.setSingleShot(True)
+        self.tree_refresh_timer.setInterval(50)
+        self.tree_refresh_timer.timeout.connect(self._refresh_tree)
 
         self.parent_categories_to_collapse = items_to_collapse
 
@@ -296,6 +302,21 @@ class CoreTab(QtWidgets.QWidget):
         else:
             self.layout.addStretch(1)
 
+    def refresh_tree(self):
+        """
+        Rebuilds the tree from the latest tree data. The rebuild is deferred briefly and restarting the timer
+        collapses repeated requests into a single rebuild
+        """
+        self.tree_refresh_timer.start()
+
+    def _refresh_tree(self):
+        """
+        Gets the tree data and rebuilds the tree, called when the refresh timer times out. Tabs that show a tree
+        provide build_tree_data()
+        """
+        tree_data, col_count, existing_items_in_config_file = self.build_tree_data()
+        self.build_tree(tree_data, col_count, existing_items_in_config_file)
+
     def build_tree(self, tree_data=None, col_count=None, existing_items_in_config_file=None):
         """
         Calling this method with no existing tree creates a pyani.core.ui.CheckboxTreeWidget tree object.
@@ -803,7 +824,7 @@ class ReviewTab(CoreTab):
                 "No review files exist for today's date."
                 "</p>".format(
                     pyani.core.ui.FONT_FAMILY,
-                    pyani.core.ui.RED.name()
+                    pyani.core.ui.RED_NAME
                 )
             )
             msg_win = pyani.core.ui.QtMsgWindow(self)
@@ -1241,8 +1262,7 @@ class AssetComponentTab(CoreTab):
         """
         if str(asset_component).lower() == self.name.lower():
             self.asset_report.generate_asset_update_report(asset_mngr=self.mngr)
-            tree_data, col_count, existing_assets_in_config_file = self.build_tree_data()
-            self.build_tree(tree_data, col_count, existing_assets_in_config_file)
+            self.refresh_tree()
 
     def tracking_finished(self, tracking_info):
         """
@@ -1354,8 +1374,7 @@ class AssetComponentTab(CoreTab):
         else:
             self.msg_win.show_info_msg("Saved", "The asset update config file was saved.")
         # finished saving, refresh ui
-        tree_data, col_count, existing_assets_in_config_file = self.build_tree_data()
-        self.build_tree(tree_data, col_count, existing_assets_in_config_file)
+        self.refresh_tree()
 
     def get_notes(self, item):
         """
@@ -1554,7 +1573,7 @@ class AssetComponentTab(CoreTab):
                             if not json_data["version"] == asset_version:
                                 row_text[1] = "{0} / ({1})".format(json_data["version"], asset_version)
                                 # keep the first color, but replace white with red for version
-                                row_color = [row_color[0], pyani.core.ui.RED.name()]
+                                row_color = [row_color[0], pyani.core.ui.RED_NAME]
 
                         # check if asset is publishable
                         if not self.mngr.is_asset_approved(asset_type, self.asset_component, asset_name):
@@ -1733,8 +1752,7 @@ class ToolsTab(CoreTab):
                 self.msg_win.show_error_msg("File Sync Warning", error_msg)
 
             self.asset_report.generate_asset_update_report(tools_mngr=self.mngr)
-            tree_data, col_count, existing_assets_in_config_file = self.build_tree_data()
-            self.build_tree(tree_data, col_count, existing_assets_in_config_file)
+            self.refresh_tree()
 
     def sync_tools_with_cgt(self):
         """
@@ -1863,8 +1881,7 @@ class ToolsTab(CoreTab):
             else:
                 self.msg_win.show_info_msg("Saved", "The update config file was saved.")
             # finished saving, refresh ui
-            tree_data, col_count, existing_assets_in_config_file = self.build_tree_data()
-            self.build_tree(tree_data, col_count, existing_assets_in_config_file)
+            self.refresh_tree()
 
     def build_tree_data(self):
         """
@@ -1931,7 +1948,7 @@ class ToolsTab(CoreTab):
                         if not local_version == cgt_version:
                             row_text[1] = "{0} / ({1})".format(local_version, cgt_version)
                             # keep the first color, but replace white with red for version
-                            row_color = [row_color[0], pyani.core.ui.RED.name(), pyani.core.ui.GRAY_MED]
+                            row_color = [row_color[0], pyani.core.ui.RED_NAME, pyani.core.ui.GRAY_MED]
                 tools_list.append(pyani.core.ui.CheckboxTreeWidgetItem(row_text, colors=row_color))
             tree_items.append(
                 {
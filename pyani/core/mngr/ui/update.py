@@ -64,7 +64,9 @@ class AniUpdateGui(pyani.core.mngr.ui.core.AniTaskListWindow):
                 'finish signal': self.core_mngr.finished_signal,
                 'error signal': self.core_mngr.error_thread_signal,
                 'thread task': True,
-                'desc': "List of sequences and their shots updated."
+                'desc': "List of sequences and their shots updated.",
+                # independent cgt call, overlap it with the remaining steps
+                'run parallel': True
             },
             # update desktop shortcut
             {
@@ -164,7 +166,9 @@ class AniUpdateGui(pyani.core.mngr.ui.core.AniTaskListWindow):
                     'thread task': False,
                     'desc': "Checked for any new audio and saved report in {0}.".format(
                         self.asset_mngr.app_vars.audio_excel_report_dir
-                    )
+                    ),
+                    # needs the sequence list, which is updated in parallel
+                    'wait for parallel': True
                 }
             )
             progress_list.append("Checking all show audio for changes.")
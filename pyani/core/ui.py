@@ -1,4 +1,7 @@
 import os
+import re
+import math
+import time
 import sys
 import traceback
 import shutil
@@ -10,6 +13,8 @@ import pyani.core.util
 import pyani.core.error_logging
 import pyani.core.appvars
 import datetime
+import collections
+import scandir
 
 
 logger = logging.getLogger()
@@ -39,6 +44,8 @@ CYAN = "#429db6"
 WHITE = "#ffffff"
 YELLOW = QtGui.QColor(234, 192, 25)
 RED = QtGui.QColor(216, 81, 81)
+# hex name of RED for html and style sheets, computed once instead of calling RED.name() every time
+RED_NAME = RED.name()
 GRAY_MED = "#999999"
 
 # FONTS
@@ -113,9 +120,11 @@ class Worker(QtCore.QRunnable):
         try:
             result = self.fn(*self.args, **self.kwargs)
         except:
-            traceback.print_exc()
+            # format the traceback once, used for both the console and the error signal
+            error_trace = traceback.format_exc()
+            sys.stderr.write(error_trace)
             exception_type, value = sys.exc_info()[:2]
-            self.signals.error.emit((exception_type, value, traceback.format_exc()))
+            self.signals.error.emit((exception_type, value, error_trace))
         else:
             # Return the result of the processing
             self.signals.result.emit(result)
@@ -124,6 +133,19 @@ class Worker(QtCore.QRunnable):
             self.signals.finished.emit()
 
 
+# units to show a download's file size in, as (bytes per unit, unit name)
+_FILE_SIZE_UNITS = ((1000.0, "KB"), (1000000.0, "MB"), (1000000000.0, "GB"))
+
+# the kinds of lines in cgt's download output, matched in one pass. the named group that matched says which kind
+# of line it is, and the number groups hold the values
+_CGT_OUTPUT_RE = re.compile(
+    r"(?P<file_dirs_to_dl>file_dirs_to_dl)"
+    r"|(?P<file_total>file_total:\s*(?P<total>\d+))"
+    r"|(?P<file_size>file_size:\s*(?P<size>[\d.]+))"
+    r"|(?P<progress>progress\S*\s+(?P<percent>[\d.]+))"
+)
+
+
 class CGTDownloadMonitor(QThread):
     """
     Monitors the output from CGT's download process. Looks for lines of output:
@@ -134,6 +156,10 @@ class CGTDownloadMonitor(QThread):
     Takes a command to execute - should be python interpreter path and then the python file as a list, for example:
     ["C:\cgteamwork\python\python.exe", "C:\PyAniTools\lib\cgt\cgt_download.py"]
 
+    The output is read with blocking reads on this thread. Reads release the GIL while waiting, so the thread costs
+    nothing while the download is quiet. Windows pipes can't be polled with select, so an event loop wouldn't save a
+    thread here.
+
     There are two modes
 
     1. Download a single file - shows progress of the download as percentage of the file size downloaded
@@ -178,6 +204,8 @@ class CGTDownloadMonitor(QThread):
         self.download_cmd = cmd
         # use -u to help with buffer
         self.python_exe = ["C:\Python27\python.exe", "-u"]
+        # least time in seconds between single file progress updates sent to the main window
+        self.progress_emit_interval = 1.0 / 30.0
 
     @property
     def download_cmd(self):
@@ -200,21 +228,30 @@ class CGTDownloadMonitor(QThread):
         Documents\maya\plug-ins\eyeBallNode\eyeBallNode.py,C:\Users\Patrick\Documents\maya\plug-ins\eyeBallNode\
         plugin_version.json
         """
-        process = Popen(self.python_exe + self.download_cmd, shell=True, stdout=PIPE, stderr=STDOUT)
+        # the command is a list starting with the python exe, so run it directly rather than through a shell. stdout
+        # is read straight from its file descriptor in large chunks by _read_lines, so the file object's buffering
+        # isn't used
+        process = Popen(self.python_exe + self.download_cmd, stdout=PIPE, stderr=STDOUT)
         files_total = 0
         files_downloaded = 0
+        output_tail = collections.deque(maxlen=200)
+        # time the last single file progress update was sent
+        last_progress_emit = 0.0
+        # set once the file total is known, true when downloading a list of files rather than one file
+        multi_file = False
 
-        # Poll process for new output until finished
-        while True:
-            next_line = process.stdout.readline()
-            if next_line == '' and process.poll() is not None:
-                break
+        # process output a line at a time until finished
+        for next_line in self._read_lines(process.stdout):
+            line_match = _CGT_OUTPUT_RE.search(next_line)
+            line_type = line_match.lastgroup if line_match else None
 
             # --------------------------------------------
             # check if any files need to be deleted locally
             # first get the download folders so we can get the local files
-            if 'file_dirs_to_dl' in next_line:
+            if line_type == 'file_dirs_to_dl':
                 existing_files = []
+                # line endings are removed from the whole line once, rather than from every directory and file name
+                next_line = next_line.replace("\r", "").replace("\n", "")
                 file_dirs_next_line = next_line.split("@")[0]
                 file_names_next_line = next_line.split("@")[-1]
 
@@ -222,76 +259,72 @@ class CGTDownloadMonitor(QThread):
                 temp = file_dirs_next_line.split("#")[-1]
                 # the download folders
                 dl_dirs = temp.split(",")
-                dl_dirs = [dl_dir.replace("\n", "") for dl_dir in dl_dirs]
-                dl_dirs = [dl_dir.replace("\r", "") for dl_dir in dl_dirs]
-                # list of files locally in download folders
+                # list of files and folders locally in download folders, as (path, is a file) so the file check made
+                # while scanning can be reused when removing
                 for dl_dir in dl_dirs:
                     # make sure folder exists
                     if os.path.exists(dl_dir):
-                        for root, directories, file_names in os.walk(dl_dir):
-                            for directory in directories:
-                                existing_files.append(os.path.join(root, directory))
-                            for filename in file_names:
-                                existing_files.append(os.path.join(root, filename))
+                        existing_files.extend(self._scan_dir(dl_dir))
                 # now check if any local files aren't on CGT
                 # remove 'file_list'
                 temp = file_names_next_line.split("#")[-1]
-                # list of files in CGT
-                file_names = temp.split(",")
-                # look for any "/" and remove "\r" and "\n"
-                file_names = [os.path.normpath(file_name) for file_name in file_names]
-                file_names = [file_name.replace("\r", "") for file_name in file_names]
-                file_names = [file_name.replace("\n", "") for file_name in file_names]
-
-                for existing_file in existing_files:
+                # files in CGT, look for any "/". A set since every local file is looked up
+                file_names = frozenset(
+                    os.path.normpath(file_name) for file_name in temp.split(",") if file_name
+                )
+
+                for existing_file, is_file in existing_files:
                     # look for any files that exist locally but are not in CGT
                     if existing_file not in file_names:
-                        if os.path.isfile(existing_file):
+                        if is_file:
                             os.remove(existing_file)
                         else:
-                            # only remove directories if empty
-                            if not os.listdir(existing_file):
+                            # only remove directories if empty, stops at the first entry instead of listing them all
+                            if next(scandir.scandir(existing_file), None) is None:
                                 shutil.rmtree(existing_file, ignore_errors=True)
 
             # get the number of files to download
-            if 'file_total' in next_line:
-                files_total = int(next_line.split(":")[-1])
-            # if the file total is greater than 1, then its a file list, and process download completion percentage
-            # as files downloaded / file total since cgt can't provide an overall file download progress with multiple
-            # files.
-            if files_total > 1:
-                # fire signal so main window knows number of files
-                self.data_downloaded.emit("file_total:{0}".format(files_total))
-            # only one file, so we can use cgt's progress
-            else:
-                if 'file_size' in next_line:
-                    # convert bytes to kb, mb, or gb depending on number of digits in bytes
-                    bytes_size = float(next_line.split(":")[-1])
-                    num_digits = pyani.core.util.number_of_digits(bytes_size)
-                    if num_digits < 7:
-                        converted_size = "{0} KB".format(bytes_size / 1000.0)
-                    elif num_digits < 10:
-                        converted_size = "{0} MB".format(bytes_size / 1000000.0)
-                    else:
-                        converted_size = "{0} GB".format(bytes_size / 1000000000.0)
-                    # fire signal so main window knows file size
-                    self.data_downloaded.emit("file_size:{0}".format(converted_size))
-
+            elif line_type == 'file_total':
+                files_total = int(line_match.group('total'))
+                # if the file total is greater than 1, then its a file list, and process download completion
+                # percentage as files downloaded / file total since cgt can't provide an overall file download
+                # progress with multiple files. fire signal once so main window knows number of files
+                multi_file = files_total > 1
+                if multi_file:
+                    self.data_downloaded.emit("file_total:{0}".format(files_total))
+            # only one file, so we can use cgt's progress and show the file size
+            elif line_type == 'file_size' and not multi_file:
+                # convert bytes to kb, mb, or gb depending on number of digits in bytes - under 7 digits is kb,
+                # under 10 is mb, otherwise gb. Every 3 digits moves up a unit
+                bytes_size = float(line_match.group('size'))
+                if bytes_size < 1000000.0:
+                    unit_index = 0
+                else:
+                    unit_index = min(int(math.log10(bytes_size)) // 3 - 1, len(_FILE_SIZE_UNITS) - 1)
+                unit_scale, unit_name = _FILE_SIZE_UNITS[unit_index]
+                converted_size = "{0} {1}".format(bytes_size / unit_scale, unit_name)
+                # fire signal so main window knows file size
+                self.data_downloaded.emit("file_size:{0}".format(converted_size))
             # monitor for progress updates
-            if 'progress' in next_line:
-                percent_done = next_line.split(" ")[1]
+            elif line_type == 'progress':
+                percent_done = line_match.group('percent')
                 # if there are multiple files, show download progress as files downloaded / files total
-                if files_total > 1:
+                if multi_file:
                     if float(percent_done) == 100.0:
                         files_downloaded += 1
                         percent = float(files_downloaded) / float(files_total) * 100.0
                         self.data_downloaded.emit(percent)
-                # one file, show actual progress
+                # one file, show actual progress. cgt reports progress far more often than the progress bar can show
+                # it, so only send it every so often, and always send the end of the download
                 else:
-                    self.data_downloaded.emit(float(percent_done))
+                    percent = float(percent_done)
+                    now = time.time()
+                    if percent >= 100.0 or now - last_progress_emit >= self.progress_emit_interval:
+                        last_progress_emit = now
+                        self.data_downloaded.emit(percent)
 
-            sys.stdout.write(next_line)
-            sys.stdout.flush()
+            # keep the latest output for the log if the download fails, rather than echoing every line to stdout
+            output_tail.append(next_line)
 
         # finished, check whether anything downloaded or if user has the latest and let main window know
         if files_downloaded == 0:
@@ -301,13 +334,56 @@ class CGTDownloadMonitor(QThread):
             # downloaded successfully
             self.data_downloaded.emit("done")
 
-        output = process.communicate()[0]
-        exit_code = process.returncode
+        # all output was already read above, so just close the pipe and wait for the exit code
+        process.stdout.close()
+        exit_code = process.wait()
 
-        if exit_code == 0:
-            print output
-        else:
-            print "error : exit code {0}".format(exit_code)
+        if exit_code != 0:
+            logger.error(
+                "CGT download process failed with exit code {0}. Last output was:\n{1}".format(
+                    exit_code, "".join(output_tail)
+                )
+            )
+
+    @staticmethod
+    def _scan_dir(path):
+        """
+        Recursively lists a folder's files and folders. Uses scandir so whether an entry is a file comes from the
+        directory listing instead of a stat call per entry
+        :param path: the folder to list
+        :return: yields (path, is a file) for every file and folder under the folder, a folder comes before its
+        contents
+        """
+        for entry in scandir.scandir(path):
+            yield entry.path, entry.is_file()
+            if entry.is_dir(follow_symlinks=False):
+                for sub_entry in CGTDownloadMonitor._scan_dir(entry.path):
+                    yield sub_entry
+
+    @staticmethod
+    def _read_lines(pipe, chunk_size=65536):
+        """
+        Reads a pipe in large chunks and yields its complete lines. The pipe is unbuffered, so readline() would make
+        a system call per byte. os.read returns whatever is available, so lines still arrive as soon as they are
+        written
+        :param pipe: the file object of the pipe to read, such as a process's stdout
+        :param chunk_size: the most bytes to read at once
+        :return: yields each line with its line ending, and any text after the last line ending once the pipe closes
+        """
+        fd = pipe.fileno()
+        residual = ""
+        while True:
+            chunk = os.read(fd, chunk_size)
+            # pipe closed, process is done writing
+            if not chunk:
+                break
+            lines = (residual + chunk).split("\n")
+            # last piece is a partial line, keep it until the rest arrives
+            residual = lines.pop()
+            for line in lines:
+                yield line + "\n"
+        if residual:
+            yield residual
 
 
 class BarGraph(pg.GraphicsView):
@@ -383,6 +459,9 @@ class BarGraph(pg.GraphicsView):
         self.x_axis_label = x_axis_label
         self.y_axis_label = y_axis_label
 
+        # buffer for the summed stacked bar rows, see _format_stacked_bar_data
+        self.__stack_buf = None
+
         # store main_options_widgets
         # x axis - allows un-even intervals - stores in private variable __x_axis_mapping as a dict
         # maps as {0: 'label1', 2: 'label2', ...}
@@ -446,6 +525,10 @@ class BarGraph(pg.GraphicsView):
         """
         if mapping:
             self.__x_data = dict(enumerate(mapping))
+            # the bar x positions and axis ticks only change with the mapping, so build them once here rather than
+            # every time the bars are set. The keys are the indices 0 to n-1
+            self.__x_positions = np.arange(len(self.__x_data), dtype=np.float64)
+            self.__x_ticks = self.__x_data.items()
 
     @property
     def y_data(self):
@@ -455,9 +538,17 @@ class BarGraph(pg.GraphicsView):
 
     @y_data.setter
     def y_data(self, data):
-        """ Set the y data
-        """
-        self.__y_data = data
+        """ Set the y data. The data is converted to numpy arrays once here, so the bars get arrays pyqtgraph can use
+        as is. For stacked bar graphs the components are stored as one contiguous 2D array of shape
+        (number of components, number of x values) so that every row is a bar
+        """
+        if isinstance(data, dict):
+            self.__y_data = {
+                'total': np.asarray(data['total'], dtype=np.float64),
+                'components': np.ascontiguousarray(np.asarray(data['components'], dtype=np.float64).T)
+            }
+        else:
+            self.__y_data = np.asarray(data, dtype=np.float64)
 
     @property
     def bar_width(self):
@@ -503,6 +594,8 @@ class BarGraph(pg.GraphicsView):
         the bar data across the x axis.
         """
         bar_graph_item_list = []
+        # hold auto ranging while the bars are added, so the view range is computed once instead of once per bar
+        auto_range_state = self._suspend_auto_range()
 
         # stacked bar graph
         if isinstance(self.y_data, dict):
@@ -515,7 +608,7 @@ class BarGraph(pg.GraphicsView):
             # now make the actual stacked bars
             for row_index in xrange(0, len(bar_graph_rows)):
                 bar_graph_item = pg.BarGraphItem(
-                    x=self.x_data.keys(),
+                    x=self.__x_positions,
                     height=bar_graph_rows[row_index],
                     width=self.bar_width,
                     brush=colors[row_index]
@@ -526,11 +619,12 @@ class BarGraph(pg.GraphicsView):
         else:
             bar_graph_item_list.append(
                 pg.BarGraphItem(
-                    x=self.x_data.keys(), height=self.y_data, width=self.bar_width, brush=self.color
+                    x=self.__x_positions, height=self.y_data, width=self.bar_width, brush=self.color
                 )
             )
             self.__plot_item.addItem(bar_graph_item_list[0])
 
+        self._restore_auto_range(auto_range_state)
         return bar_graph_item_list
 
     def update_graph(
@@ -569,7 +663,10 @@ class BarGraph(pg.GraphicsView):
 
         # number of bars needed is the total (which is 1 bar) + the number of components or sub bars. Note if its not
         # a stacked bar graph component length will be zero
-        num_bars_needed = 1 + len(self.y_data['components'][0])
+        num_bars_needed = 1 + self.y_data['components'].shape[0]
+
+        # hold auto ranging while bars are added and set, every setOpts would otherwise recompute the view range
+        auto_range_state = self._suspend_auto_range()
 
         # check if need to create more bars
         if len(self.bar_graph_item_list) < num_bars_needed:
@@ -588,75 +685,97 @@ class BarGraph(pg.GraphicsView):
         # add the component colors to the list
         colors.extend(self.color['components'])
 
-        # reset bars to a height of zero
-        for bar in self.bar_graph_item_list:
-            bar.setOpts(
-                x=[0.0],
-                height=[0.0]
-            )
-        # set data for single and stacked bar graphs
+        # set data for single and stacked bar graphs. Each bar is set once, bars getting new data aren't zeroed first
         if isinstance(self.y_data, dict):
             # stacked bar graph data formatted
             bar_graph_rows = self._format_stacked_bar_data()
             # now make the actual stacked bars
             for bar_index in xrange(0, len(bar_graph_rows)):
                 self.bar_graph_item_list[bar_index].setOpts(
-                    x=self.x_data.keys(),
+                    x=self.__x_positions,
                     height=bar_graph_rows[bar_index],
                     width=self.bar_width,
                     brush=colors[bar_index]
                 )
+            bars_set = len(bar_graph_rows)
         # single bar graph
         else:
             self.bar_graph_item_list[0].setOpts(
-                x=self.x_data.keys(),
+                x=self.__x_positions,
                 height=self.y_data,
                 width=self.bar_width,
                 brush=self.color[0]
             )
+            bars_set = 1
+        # reset any bars left over from a graph with more bars to a height of zero
+        for bar in self.bar_graph_item_list[bars_set:]:
+            bar.setOpts(
+                x=[0.0],
+                height=[0.0]
+            )
+        self._restore_auto_range(auto_range_state)
         # update the labels
         self.__plot_item.setLabel('left', text=self.y_axis_label)
         self.__plot_item.setLabel('bottom', text=self.x_axis_label)
         # update the x axis mapping
         self.update_x_axis()
 
+    def _suspend_auto_range(self):
+        """
+        Turns off auto ranging on the plot's view box, so that adding or setting several bars doesn't recompute the
+        view range for each bar
+        :return: the auto range state of the x and y axis before it was turned off, pass to _restore_auto_range
+        """
+        view_box = self.__plot_item.vb
+        auto_range_state = list(view_box.autoRangeEnabled())
+        view_box.disableAutoRange()
+        return auto_range_state
+
+    def _restore_auto_range(self, auto_range_state):
+        """
+        Turns auto ranging back on for the axes that had it, which updates the view range once for all bar changes
+        :param auto_range_state: the auto range state returned by _suspend_auto_range
+        """
+        view_box = self.__plot_item.vb
+        for axis, enabled in zip((view_box.XAxis, view_box.YAxis), auto_range_state):
+            if enabled is not False:
+                view_box.enableAutoRange(axis=axis, enable=enabled)
+
     def update_x_axis(self):
         """
         Updates the x axis with the latest x axis mapping
         """
         x_axis = self.__plot_item.getAxis('bottom')
-        x_axis.setTicks([self.x_data.items()])
+        x_axis.setTicks([self.__x_ticks])
 
     def _format_stacked_bar_data(self):
         """
         Formats the data for stacked bar graphs
-        :return: a 2D list of data that the pyqtgraph bar graph class will accept. Format:
-        [ python list that is the size of the number of sequences, shots or frames] each element of
-        the list is a bar that is [is the size of the number of stacked bars or total + number of components]
+        :return: a list of data that the pyqtgraph bar graph class will accept. Format:
+        [ python list that is the size of the number of stacked bars or total + number of components] each element of
+        the list is a numpy array of bar heights that is the size of the number of sequences, shots or frames
         """
         bar_graph_rows = []
         # stacked bar graph
         if isinstance(self.y_data, dict):
             # total is the overall height of the bar
             total = self.y_data['total']
-            # convert the components to a numpy array - easier to add - we switch the axis so that in the 2d array
-            # rows become cols, cols become rows. Makes it so that the rows can be fed to the bar graph
-            components_rows = np.stack(self.y_data['components'], axis=1)
+            # the components are already stored with one row per component, see the y_data setter
+            components_rows = self.y_data['components']
 
             # the data to send to the bar graph class, where each index is a row of bar graph data. Start with total,
             # its the largest number. If the components don't add up to the total, the unknown amount will shade the
             # color specified for total, otherwise you won't see the total at all.
             bar_graph_rows = [total]
 
-            # loop through and add up the components so that each component sits on top of the other (no overlap)
-            # The idea is to build a list or array of the bars so that bar2 sits on bar1, bar3 sits on bar2 and so on.
-            for i in xrange(0, len(components_rows)):
-                # this is the size of the x axis
-                summed_rows = np.array([0.0] * len(total))
-                # we loop through the components, adding up
-                for j in xrange(i, len(components_rows)):
-                    summed_rows += components_rows[j]
-                bar_graph_rows.append(np.ndarray.tolist(summed_rows))
+            # add up the components so that each component sits on top of the other (no overlap). The idea is to
+            # build a list or array of the bars so that bar2 sits on bar1, bar3 sits on bar2 and so on. Row i is the
+            # sum of components i through the last one, which is a cumulative sum taken from the last row backwards.
+            # The sums go in a buffer that is only reallocated when the shape of the data changes
+            if self.__stack_buf is None or self.__stack_buf.shape != components_rows.shape:
+                self.__stack_buf = np.empty(components_rows.shape, dtype=np.float64)
+            np.cumsum(components_rows[::-1], axis=0, out=self.__stack_buf[::-1])
+            bar_graph_rows.extend(self.__stack_buf)
         return bar_graph_rows
 
 
@@ -705,12 +824,13 @@ class TranslucentWidget(QtWidgets.QWidget):
 
         # set attributes defaults - colors, window size
 
-        # window bg and border color (outside/behind popup window - the one pop up covers)
-        self.__fill_color_outside_popup = QtGui.QColor(0, 0, 0, 0)
-        self.__pen_color_outside_popup = QtGui.QColor(0, 0, 0, 0)
+        # window bg and border color (outside/behind popup window - the one pop up covers). Kept as the brush and
+        # pen paintEvent uses, so they aren't built from the colors on every paint
+        self.__fill_color_outside_popup = QtGui.QBrush(QtGui.QColor(0, 0, 0, 0))
+        self.__pen_color_outside_popup = QtGui.QPen(QtGui.QColor(0, 0, 0, 0))
         # popup window bg and border color
-        self.__fill_color_popup = QtGui.QColor(150, 150, 150, 150)
-        self.__pen_color_popup = QtGui.QColor(150, 150, 150, 255)
+        self.__fill_color_popup = QtGui.QBrush(QtGui.QColor(150, 150, 150, 150))
+        self.__pen_color_popup = QtGui.QPen(QtGui.QColor(150, 150, 150, 255))
         # close button color
         self.close_btn.setStyleSheet("background-color: rgb(0, 0, 0, 0); color: rgb(0, 0, 0, 255)")
 
@@ -720,6 +840,8 @@ class TranslucentWidget(QtWidgets.QWidget):
 
         # the text in the window
         self.__text = "<font size='4'>Html formatted text here</font>"
+        # the text parsed and laid out, built on the first paint after the text is set
+        self.__text_doc = None
 
         self.set_slots()
         self.SIGNALS = TranslucentWidgetSignals()
@@ -743,11 +865,11 @@ class TranslucentWidget(QtWidgets.QWidget):
         :param border: rgba as a tuple i.e (255, 255, 255, 255)
         :param btn_color: rgba as a tuple i.e (255, 255, 255, 255)
         """
-        self.__fill_color_outside_popup = QtGui.QColor(0, 0, 0, 0)
-        self.__pen_color_outside_popup = QtGui.QColor(0, 0, 0, 0)
+        self.__fill_color_outside_popup = QtGui.QBrush(QtGui.QColor(0, 0, 0, 0))
+        self.__pen_color_outside_popup = QtGui.QPen(QtGui.QColor(0, 0, 0, 0))
         # popup window bg and border color
-        self.__fill_color_popup = QtGui.QColor(fill[0], fill[1], fill[2], fill[3])
-        self.__pen_color_popup = QtGui.QColor(border[0], border[1], border[2], border[3])
+        self.__fill_color_popup = QtGui.QBrush(QtGui.QColor(fill[0], fill[1], fill[2], fill[3]))
+        self.__pen_color_popup = QtGui.QPen(QtGui.QColor(border[0], border[1], border[2], border[3]))
         # close button color
         self.close_btn.setStyleSheet(
             "background-color: rgb(0, 0, 0, 0); color: rgb({0}, {1}, {2}, {3})".format(
@@ -769,6 +891,8 @@ class TranslucentWidget(QtWidgets.QWidget):
 
     def set_text(self, text):
         self.__text = text
+        # parse the new text on the next paint
+        self.__text_doc = None
 
     def paintEvent(self, event):
         """Draw the window - note that we are really drawing over any existing window, filling the entire space. We
@@ -778,12 +902,11 @@ class TranslucentWidget(QtWidgets.QWidget):
         s = self.size()
         qp = QtGui.QPainter()
         qp.begin(self)
-        qp.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        # draw bg window, one behind popup
+        # draw bg window, one behind popup. Its an axis aligned rectangle, so it doesn't need antialiasing
         qp.setPen(self.__pen_color_outside_popup)
         qp.setBrush(self.__fill_color_outside_popup)
         qp.drawRect(0, 0, s.width(), s.height())
-        # draw popup
+        # draw popup. The corners are only 5 pixels round, so the rectangle is drawn without antialiasing too
         qp.setPen(self.__pen_color_popup)
         qp.setBrush(self.__fill_color_popup)
         # left edge
@@ -791,17 +914,47 @@ class TranslucentWidget(QtWidgets.QWidget):
         # top edge
         top_edge = int(s.height() / 2 - self.__popup_height / 2)
         qp.drawRoundedRect(left_edge, top_edge, self.__popup_width, self.__popup_height, 5, 5)
-        # draw text - use html
-        td = QtGui.QTextDocument()
-        td.setHtml(self.__text)
+        # the text is antialiased
+        qp.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        # draw text - use html. The document is kept until the text changes, so the html is only parsed once. A
+        # QTextDocument rather than QStaticText because the text can have tables (see the image viewer's metadata),
+        # which QStaticText doesn't lay out. The document is display only, so don't keep an undo history for it
+        if self.__text_doc is None:
+            self.__text_doc = QtGui.QTextDocument()
+            self.__text_doc.setUndoRedoEnabled(False)
+            self.__text_doc.setHtml(self.__text)
         qp.translate(left_edge, top_edge)
-        td.drawContents(qp, QtCore.QRectF(0, 0, self.__popup_width, self.__popup_height))
+        self.__text_doc.drawContents(qp, QtCore.QRectF(0, 0, self.__popup_width, self.__popup_height))
         qp.end()
 
+    @pyqtSlot()
     def _on_close(self):
         self.SIGNALS.CLOSE.emit()
 
 
+# window fonts by (point size, bold), shared by all windows. Made the first time a window needs them rather than at
+# import, since fonts need the application to exist
+_window_font_cache = dict()
+
+
+def _window_font(point_size=None, bold=False):
+    """
+    Gets a font shared by all windows, only builds it the first time it's asked for
+    :param point_size: optional point size, defaults to qt's default size
+    :param bold: whether the font is bold
+    :return: the QFont
+    """
+    key = (point_size, bold)
+    font = _window_font_cache.get(key)
+    if font is None:
+        font = QtGui.QFont()
+        if point_size:
+            font.setPointSize(point_size)
+        font.setBold(bold)
+        _window_font_cache[key] = font
+    return font
+
+
 class AniQMainWindow(QtWidgets.QMainWindow):
     """
     Builds a QMain Window with the given title, icon and optional width and height
@@ -860,6 +1013,19 @@ class AniQMainWindow(QtWidgets.QMainWindow):
     :param show_help: optional boolean whether to show a link to a confluence help page
     :param disable_version: optional boolean if True doesn't show or get version info.
     """
+    # html for the version label, the font size and family are {0} and {1}. The out of date and unavailable colors
+    # are put in once here rather than every time a window is made
+    _VERS_HTML_CURRENT = "<span style='font-size:{0}pt; font-family:{1}; color:#ffffff;'>Version: {2}</span>"
+    _VERS_HTML_OUT_OF_DATE = (
+        "<span style='font-size:{0}pt; font-family:{1}; color:#ffffff;'>Version (out of date): </span>"
+        "<span style='font-size:{0}pt; font-family:{1}; color:" + RED_NAME + ";'>local version: {2}</span>"
+        "<span style='font-size:{0}pt; font-family:{1}; color:#ffffff;'> / {3}</span>"
+    )
+    _VERS_HTML_LOADING = "<span style='font-size:{0}pt; font-family:{1}; color:#ffffff;'>Version: loading...</span>"
+    _VERS_HTML_UNAVAILABLE = (
+        "<span style='font-size:{0}pt; font-family:{1}; color:" + RED_NAME + ";'>Version Data Unavailable</span>"
+    )
+
     def __init__(
             self,
             win_title,
@@ -889,7 +1055,7 @@ class AniQMainWindow(QtWidgets.QMainWindow):
         self.tool_category = tool_metadata['category']
         self.tool_mngr = tool_mngr
         self.show_help = show_help
-        app_vars = pyani.core.appvars.AppVars()
+        app_vars = pyani.core.appvars.get_app_vars()
 
         # COMMON UI ELEMENTS
 
@@ -900,6 +1066,8 @@ class AniQMainWindow(QtWidgets.QMainWindow):
 
         # tab support
         self.has_tabs = has_tabs
+        # whether the current drag has urls, see dragEnterEvent
+        self._drag_has_urls = False
 
         # main widget for window
         self.main_win = QtWidgets.QWidget()
@@ -912,19 +1080,20 @@ class AniQMainWindow(QtWidgets.QMainWindow):
         self.font_family = pyani.core.ui.FONT_FAMILY
         self.font_size = pyani.core.ui.FONT_SIZE_DEFAULT
 
-        # version info
+        # version info, set once the worker thread loads it, see _set_version_label
         self.vers_label = QtWidgets.QLabel()
+        self.local_version = None
+        self.cgt_version = None
+        # set when the window closes, the version worker can finish after that and its result is then ignored
+        self._closed = False
 
         # main layout
         self.main_layout = QtWidgets.QVBoxLayout()
 
-        # set font size and style for title labels
-        self.titles = QtGui.QFont()
-        self.titles.setPointSize(14)
-        self.titles.setBold(True)
-        self.bold_font = QtGui.QFont()
-        self.bold_font.setBold(True)
-        # spacer to use between sections
+        # set font size and style for title labels, the fonts are the same for every window so they are shared
+        self.titles = _window_font(point_size=14, bold=True)
+        self.bold_font = _window_font(bold=True)
+        # spacer to use between sections. Each window needs its own, a layout takes ownership of the spacers added to it
         self.v_spacer = QtWidgets.QSpacerItem(0, 35)
         self.empty_space = QtWidgets.QSpacerItem(1, 1)
         self.horizontal_spacer = QtWidgets.QSpacerItem(50, 0)
@@ -932,10 +1101,13 @@ class AniQMainWindow(QtWidgets.QMainWindow):
 
         # help doc button
         if self.show_help:
+            # the hover and pressed images are the same, so build each path once
+            help_images_dir = os.path.join(app_vars.local_pyanitools_core_dir, "images")
+            help_on_image = os.path.join(help_images_dir, "help_on.png")
             self.btn_help_doc = pyani.core.ui.ImageButton(
-                "{0}\\images\\help_off.png".format(app_vars.local_pyanitools_core_dir),
-                "{0}\\images\\help_on.png".format(app_vars.local_pyanitools_core_dir),
-                "{0}\\images\\help_on.png".format(app_vars.local_pyanitools_core_dir),
+                os.path.join(help_images_dir, "help_off.png"),
+                help_on_image,
+                help_on_image,
                 size=(148, 38)
             )
             self.btn_help_doc.clicked.connect(self._open_help_doc)
@@ -944,64 +1116,14 @@ class AniQMainWindow(QtWidgets.QMainWindow):
 
         # check if version should be shown
         if not disable_version:
-            # try to load cgt meta data for tool type which has version info for the local files, this is the
-            # version on disk locally, could be different than cloud version
-            try:
-                self.local_version = self.tool_mngr.get_tool_local_version(self.tool_dir, self.tool_name)
-                self.cgt_version = self.tool_mngr.get_tool_newest_version(
-                    self.tool_type,
-                    self.tool_category,
-                    self.tool_name
-                )
-
-                if self.local_version == self.cgt_version:
-                    self.vers_label.setText(
-                        "<span style='font-size:{0}pt; font-family:{1}; color:#ffffff;'>Version: {2}</span>".format(
-                            self.font_size,
-                            self.font_family,
-                            self.local_version
-                        )
-                    )
-                else:
-
-                    if not self.cgt_version:
-                        self.cgt_version = "server version: n/a"
-
-                    self.vers_label.setText(
-                        "<span style='font-size:{0}pt; font-family:{1}; color:#ffffff;'>Version (out of date): </span>"
-                        "<span style='font-size:{0}pt; font-family:{1}; color:{2};'>local version: {3}</span>"
-                        "<span style='font-size:{0}pt; font-family:{1}; color:#ffffff;'> / {4}</span>".format(
-                            self.font_size,
-                            self.font_family,
-                            RED.name(),
-                            self.local_version,
-                            self.cgt_version
-                        )
-                    )
-                logging.info(
-                    "User version: {0}, Latest Version {1}".format(
-                        self.local_version,
-                        self.cgt_version
-                    )
-                )
-            except (TypeError, KeyError, ValueError) as e:
-                logger.exception("Type, Key, or Value error loading version info: {0}".format(e))
-                self.vers_label.setText(
-                    "<span style='font-size:{0}pt; font-family:{1}; color:{2};'>Version Data Unavailable</span>".format(
-                        self.font_size,
-                        self.font_family,
-                        RED.name()
-                    )
-                )
-
-                self.msg_win.show_warning_msg(
-                    "Version Warning",
-                    "There was a problem loading the version information. You can continue, but please "
-                    "file a jira and attach the latest log file from here {0}. The error reported is: {1}".format(
-                        log_name,
-                        e
-                    )
-                )
+            # the version info is read off disk on a worker thread so the window can show right away, until then
+            # show that its loading
+            self.__log_name = log_name
+            self.vers_label.setText(self._VERS_HTML_LOADING.format(self.font_size, self.font_family))
+            self.__version_worker = Worker(self._fetch_versions, False)
+            self.__version_worker.signals.result.connect(self._set_version_label)
+            self.__version_worker.signals.error.connect(self._version_error)
+            QtCore.QThreadPool.globalInstance().start(self.__version_worker)
         else:
             self.vers_label.setText("")
 
@@ -1012,6 +1134,86 @@ class AniQMainWindow(QtWidgets.QMainWindow):
         # center the window
         center(self)
 
+    def _fetch_versions(self):
+        """
+        Loads the cgt meta data for the tool which has version info for the local files, this is the version on disk
+        locally, could be different than cloud version. Runs on a worker thread, see __init__
+        :return: a tuple of the local version and the newest version on the server
+        """
+        local_version = self.tool_mngr.get_tool_local_version(self.tool_dir, self.tool_name)
+        cgt_version = self.tool_mngr.get_tool_newest_version(
+            self.tool_type,
+            self.tool_category,
+            self.tool_name
+        )
+        return local_version, cgt_version
+
+    @pyqtSlot(object)
+    def _set_version_label(self, versions):
+        """
+        Shows the version info once the worker thread has loaded it
+        :param versions: a tuple of the local version and the newest version on the server
+        """
+        if self._closed:
+            return
+
+        self.local_version, self.cgt_version = versions
+
+        if self.local_version == self.cgt_version:
+            self.vers_label.setText(
+                self._VERS_HTML_CURRENT.format(self.font_size, self.font_family, self.local_version)
+            )
+        else:
+
+            if not self.cgt_version:
+                self.cgt_version = "server version: n/a"
+
+            self.vers_label.setText(
+                self._VERS_HTML_OUT_OF_DATE.format(
+                    self.font_size,
+                    self.font_family,
+                    self.local_version,
+                    self.cgt_version
+                )
+            )
+        # only format the message when it will be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "User version: {0}, Latest Version {1}".format(
+                    self.local_version,
+                    self.cgt_version
+                )
+            )
+
+    @pyqtSlot(tuple)
+    def _version_error(self, error):
+        """
+        Shows that the version info couldn't be loaded and warns the user
+        :param error: a tuple of the exception type, the exception and the formatted traceback from the worker thread
+        """
+        exception_type, e, error_trace = error
+        logger.error("{0} loading version info: {1}\n{2}".format(exception_type.__name__, e, error_trace))
+        if self._closed:
+            return
+        self.vers_label.setText(self._VERS_HTML_UNAVAILABLE.format(self.font_size, self.font_family))
+
+        self.msg_win.show_warning_msg(
+            "Version Warning",
+            "There was a problem loading the version information. You can continue, but please "
+            "file a jira and attach the latest log file from here {0}. The error reported is: {1}".format(
+                self.__log_name,
+                e
+            )
+        )
+
+    def closeEvent(self, event):
+        """
+        Marks the window closed so a version worker that finishes afterwards doesn't update it
+        :param event: the window close event
+        """
+        self._closed = True
+        super(AniQMainWindow, self).closeEvent(event)
+
     def add_layout_to_win(self):
         """Adds the main layout to the window, called by inheriting classes
         """
@@ -1034,7 +1236,9 @@ class AniQMainWindow(QtWidgets.QMainWindow):
         provides an event which is sent to the target widget as dragging action enters it.
         :param e: mime data of the event
         """
-        if e.mimeData().hasUrls:
+        # whether the drag has urls (files) is checked once as it enters, dragMoveEvent reuses it for every move
+        self._drag_has_urls = e.mimeData().hasUrls()
+        if self._drag_has_urls:
             e.accept()
         else:
             e.ignore()
@@ -1044,7 +1248,7 @@ class AniQMainWindow(QtWidgets.QMainWindow):
         called used when the drag and drop action is in progress.
         :param e: mime data of the event
         """
-        if e.mimeData().hasUrls:
+        if self._drag_has_urls:
             e.accept()
         else:
             e.ignore()
@@ -1059,17 +1263,17 @@ class AniQMainWindow(QtWidgets.QMainWindow):
         :param e: mime data of the event
         :param func : function to call to process mime data, should accept a list of strings representing filenames
         """
-        if e.mimeData().hasUrls:
+        mime_data = e.mimeData()
+        if mime_data.hasUrls():
             e.setDropAction(QtCore.Qt.CopyAction)
             e.accept()
             # Workaround for OSx dragging and dropping
-            file_names = []
-            for url in e.mimeData().urls():
-                file_names.append(str(url.toLocalFile()))
+            file_names = [str(url.toLocalFile()) for url in mime_data.urls()]
             func(file_names)
         else:
             e.ignore()
 
+    @pyqtSlot()
     def _open_help_doc(self):
         """Open help doc. Displays error if can't connect or message to user if no confluence exists.
         """
@@ -1101,6 +1305,29 @@ class AniQMainWindow(QtWidgets.QMainWindow):
         self.main_layout.addItem(QtWidgets.QSpacerItem(1, 30))
 
 
+class FileDialogIconProvider(QtWidgets.QFileIconProvider):
+    """
+    Icon provider that only hands out the generic file and folder icons. The default provider asks the OS for
+    every entry's icon, which is slow on network drives. The two icons are made once and reused.
+    """
+    def __init__(self):
+        super(FileDialogIconProvider, self).__init__()
+        self._folder_icon = super(FileDialogIconProvider, self).icon(QtWidgets.QFileIconProvider.Folder)
+        self._file_icon = super(FileDialogIconProvider, self).icon(QtWidgets.QFileIconProvider.File)
+
+    def icon(self, info):
+        """
+        Gets the icon for a file system entry
+        :param info: a QFileInfo or a QFileIconProvider.IconType
+        :return: the folder or file icon as a QIcon
+        """
+        if isinstance(info, QtCore.QFileInfo):
+            if info.isDir():
+                return self._folder_icon
+            return self._file_icon
+        return super(FileDialogIconProvider, self).icon(info)
+
+
 class FileDialog(QFileDialog):
     '''
     This function allows both files and folders to be selected. QFileDialog doesn't support
@@ -1119,10 +1346,14 @@ class FileDialog(QFileDialog):
         self.selectedFiles = []
 
         self.setOption(QFileDialog.DontUseNativeDialog, True)
+        # don't follow symlinks or ask the OS for every entry's icon when listing a directory
+        self.setOption(QFileDialog.DontResolveSymlinks, True)
+        self.icon_provider = FileDialogIconProvider()
+        self.setIconProvider(self.icon_provider)
 
         '''
         can implement if needed
-        app_vars = pyani.core.appvars.AppVars()
+        app_vars = pyani.core.appvars.get_app_vars()
         sidebarUrls = [
             QtWidgets.QDesktopServices.storageLocation(QtWidgets.QDesktopServices.DesktopLocation),
             QtWidgets.QDesktopServices.storageLocation(QtWidgets.QDesktopServices.DocumentsLocation),
@@ -1133,15 +1364,21 @@ class FileDialog(QFileDialog):
         '''
         self.setFileMode(QFileDialog.ExistingFiles)
 
-        # get all buttons and find one labeled open, connect custom event
-        btns = self.findChildren(QtWidgets.QPushButton)
-        self.openBtn = [x for x in btns if 'open' in str(x.text()).lower()][0]
+        # get the open button from the dialog's button box, connect custom event. If the button box doesn't have an
+        # open button, fall back to the first button labeled open - only the button box's few buttons are searched
+        # when there is a button box, otherwise every button in the dialog. str() since pyqt 4 gives a QString
+        button_box = self.findChild(QtWidgets.QDialogButtonBox)
+        self.openBtn = button_box.button(QtWidgets.QDialogButtonBox.Open) if button_box else None
+        if not self.openBtn:
+            buttons = button_box.buttons() if button_box else self.findChildren(QtWidgets.QPushButton)
+            self.openBtn = next(btn for btn in buttons if 'open' in str(btn.text()).lower())
         self.openBtn.clicked.disconnect()
         self.openBtn.clicked.connect(self.open_clicked)
 
         # grab the tree view
         self.tree = self.findChild(QtWidgets.QTreeView)
 
+    @pyqtSlot()
     def open_clicked(self):
         '''
         Gets the selection in the file dialog window. Stores selection in a class variable.
@@ -1149,6 +1386,8 @@ class FileDialog(QFileDialog):
         '''
         indices = self.tree.selectionModel().selectedIndexes()
         files = []
+        # every selected item is in the same directory, so only ask qt for it once
+        selected_dir = str(self.directory().absolutePath())
         for i in indices:
             if i.column() == 0:
                 item = i.data()
@@ -1160,10 +1399,14 @@ class FileDialog(QFileDialog):
                     itemName = str(item.toString())
                 else:
                     itemName = str(item)
-                files.append(os.path.join(str(self.directory().absolutePath()), itemName))
-        self.selectedFiles = files
+                files.append(os.path.join(selected_dir, itemName))
+        # normalize the paths to os path system convention and sort them once here, rather than every time the
+        # selection is asked for
+        self.selectedFiles = sorted(os.path.normpath(file_name) for file_name in files)
         self.close()
-        logger.info("File dialog class un-normalized selection: {0}".format(", ".join(self.selectedFiles)))
+        # only build the joined list when it will be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("File dialog class normalized selection: {0}".format(", ".join(self.selectedFiles)))
 
     def get_selection(self):
         '''
@@ -1171,12 +1414,28 @@ class FileDialog(QFileDialog):
         :return a list of files and folders selected in the file dialog normalized to os path system convention
         and sorted
         '''
-        # make sure paths get normalized so they are correct
-        normalized_paths = [os.path.normpath(file_name) for file_name in self.selectedFiles]
-        sorted_normalized_paths = sorted(normalized_paths)
-        logger.info("File dialog class normalized selection: {0}".format(", ".join(sorted_normalized_paths)))
-        # sort the paths
-        return sorted_normalized_paths
+        # the paths are normalized and sorted when the selection is made, see open_clicked. Return a copy so the
+        # caller can change it
+        return list(self.selectedFiles)
+
+
+# line style sheets by color, shared by all horizontal and vertical lines. Lines are colored with a style sheet rather
+# than a palette because apps run with an application style sheet (qdarkstyle), which takes priority over a widget's
+# palette, so only a widget style sheet reliably overrides the line color
+_line_style_cache = dict()
+
+
+def _line_style_sheet(color):
+    """
+    Gets the style sheet for a line of the given color, only builds it the first time a color is used
+    :param color: a color in qt css style
+    :return: the style sheet as a string
+    """
+    style = _line_style_cache.get(color)
+    if style is None:
+        style = "background-color:{0};".format(color)
+        _line_style_cache[color] = style
+    return style
 
 
 class QHLine(QtWidgets.QFrame):
@@ -1189,7 +1448,7 @@ class QHLine(QtWidgets.QFrame):
         # override behavior of style sheet
         self.setFrameShape(QtWidgets.QFrame.HLine)
         self.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.setStyleSheet("background-color:{0};".format(color))
+        self.setStyleSheet(_line_style_sheet(color))
         self.setLineWidth(1)
 
 
@@ -1206,7 +1465,7 @@ class QVLine(QtWidgets.QFrame):
         # override behavior of style sheet
         self.setFrameShape(QtWidgets.QFrame.VLine)
         self.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.setStyleSheet("background-color:{0};".format(color))
+        self.setStyleSheet(_line_style_sheet(color))
         self.setLineWidth(1)
         if size:
             self.resize(size[0], size[1])
@@ -1215,23 +1474,35 @@ class QVLine(QtWidgets.QFrame):
             self.setMaximumWidth(1)
 
 
-class QtMsgWindow(QtWidgets.QMessageBox):
+class QtMsgWindow(object):
     """
     Class to display QtMessageBox Windows
-    Takes the main window upon creation so that pop up appears over it
+    Takes the main window upon creation so that pop up appears over it. Wraps a single message box rather than
+    being one, so only one QMessageBox gets made per instance, and only once a message is shown. Every
+    AniQMainWindow has two of these, and many windows never show a message
     """
     def __init__(self, main_win):
-        super(QtMsgWindow, self).__init__()
-        # create the window and tell it to parent to the main window
-        self.msg_box = QtWidgets.QMessageBox(parent=main_win)
+        self.__main_win = main_win
+        # the message box, made the first time it's needed, see msg_box
+        self.__msg_box = None
         # member variable declaring the type of msg box, needed because a msg box without buttons must call
         # a different method than close() to close it.
         self.msg_box_type = None
 
+    @property
+    def msg_box(self):
+        """The QMessageBox, created and parented to the main window the first time it's used
+        """
+        if self.__msg_box is None:
+            self.__msg_box = QtWidgets.QMessageBox(parent=self.__main_win)
+        return self.__msg_box
+
     def hide(self):
         """Hide the msg box
         """
-        self.msg_box.hide()
+        # nothing to hide if the box was never made
+        if self.__msg_box is not None:
+            self.__msg_box.hide()
 
     def show_error_msg(self, title, msg):
         """
@@ -1239,7 +1510,7 @@ class QtMsgWindow(QtWidgets.QMessageBox):
         :param title: the window title
         :param msg: the message to the user
         """
-        self._show_message_box(title, self.Critical, msg)
+        self._show_message_box(title, QtWidgets.QMessageBox.Critical, msg)
 
     def show_warning_msg(self, title, msg):
         """
@@ -1247,7 +1518,7 @@ class QtMsgWindow(QtWidgets.QMessageBox):
         :param title: the window title
         :param msg: the message to the user
         """
-        self._show_message_box(title, self.Warning, msg)
+        self._show_message_box(title, QtWidgets.QMessageBox.Warning, msg)
 
     def show_question_msg(self, title, msg):
         """
@@ -1256,9 +1527,11 @@ class QtMsgWindow(QtWidgets.QMessageBox):
         :param msg: the message to the user
         :return: True if user presses Yes, False if user presses No
         """
-        response = self.msg_box.question(self, title, msg, self.Yes | self.No)
-        center(self.msg_box)
-        if response == self.Yes:
+        # question is static and opens its own box, so the wrapped box isn't needed (or made) for it
+        response = QtWidgets.QMessageBox.question(
+            self.__main_win, title, msg, QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
+        )
+        if response == QtWidgets.QMessageBox.Yes:
             return True
         else:
             return False
@@ -1269,13 +1542,13 @@ class QtMsgWindow(QtWidgets.QMessageBox):
         :param title: the window title
         :param msg: the message to the user
         """
-        self._show_message_box(title, self.Information, msg)
+        self._show_message_box(title, QtWidgets.QMessageBox.Information, msg)
 
     def show_msg(self, title, msg):
         self.msg_box.setWindowTitle(title)
-        self.msg_box.setIcon(self.NoIcon)
+        self.msg_box.setIcon(QtWidgets.QMessageBox.NoIcon)
         self.msg_box.setText(msg)
-        self.msg_box.setStandardButtons(self.msg_box.NoButton)
+        self.msg_box.setStandardButtons(QtWidgets.QMessageBox.NoButton)
         self.msg_box.show()
         self.msg_box_type = "no_btns"
 
@@ -1300,7 +1573,7 @@ class QtMsgWindow(QtWidgets.QMessageBox):
         self.msg_box.setWindowTitle(title)
         self.msg_box.setIcon(icon)
         self.msg_box.setText(msg)
-        self.msg_box.setStandardButtons(self.msg_box.Ok)
+        self.msg_box.setStandardButtons(QtWidgets.QMessageBox.Ok)
         self.msg_box.show()
         center(self.msg_box)
 
@@ -1380,9 +1653,8 @@ class QtInputDialogMenu(QtWidgets.QDialog):
         """Creates the window layout
         """
         layout = QtWidgets.QVBoxLayout()
-        # menu
-        for option in self.options:
-            self.menu_cbox.addItem(option)
+        # menu - add all options in one call so the combo box model is only updated once
+        self.menu_cbox.addItems(list(self.options))
         menu_label = QtWidgets.QLabel(self.options_label)
         menu_layout = QtWidgets.QHBoxLayout()
         menu_layout.addWidget(menu_label)
@@ -1416,18 +1688,24 @@ class QtInputDialogMenu(QtWidgets.QDialog):
         self.btn_ok.clicked.connect(self.ok)
         self.btn_cancel.clicked.connect(self.cancel)
 
+    @pyqtSlot()
     def ok(self):
         """Saves the current selected text in the menu
         """
         self.__selection = self.menu_cbox.currentText()
         self.close()
 
+    @pyqtSlot()
     def cancel(self):
         """Closes the window
         """
         self.close()
 
 
+# window icons by image path, so the same icon image is only read and decoded once
+_win_icon_cache = dict()
+
+
 class QtWindowUtil:
     """
     Class of utility functions common to all qt windows
@@ -1442,8 +1720,11 @@ class QtWindowUtil:
         Sets the window icon
         :param img: path to an image for the icon
         """
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(_fromUtf8(img)), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon = _win_icon_cache.get(img)
+        if icon is None:
+            icon = QtGui.QIcon()
+            icon.addPixmap(QtGui.QPixmap(_fromUtf8(img)), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+            _win_icon_cache[img] = icon
         self.__win.setWindowIcon(icon)
 
 
@@ -1454,6 +1735,24 @@ class Image(QtWidgets.QLabel):
         self.setPixmap(self.pixmap)
 
 
+# button images by image path. Buttons often share images, such as the help button in every window, so each image is
+# only read and decoded once. QPixmaps are implicitly shared, so buttons can hold the same pixmap
+_button_pixmap_cache = dict()
+
+
+def _button_pixmap(image):
+    """
+    Gets the pixmap for a button image, loading it the first time the image is used
+    :param image: absolute path to the image
+    :return: the QPixmap for the image
+    """
+    pixmap = _button_pixmap_cache.get(image)
+    if pixmap is None:
+        pixmap = QtGui.QPixmap(image)
+        _button_pixmap_cache[image] = pixmap
+    return pixmap
+
+
 class ImageButton(QtWidgets.QAbstractButton):
     """
     Creates a pyqt button that uses images (a png, jpeg, gif or other supported Qt format) and
@@ -1467,22 +1766,48 @@ class ImageButton(QtWidgets.QAbstractButton):
     """
     def __init__(self, image, image_hover, image_pressed, size=(32, 32), parent=None):
         super(ImageButton, self).__init__(parent)
-        self.pixmap = QtGui.QPixmap(image)
-        self.pixmap_hover = QtGui.QPixmap(image_hover)
-        self.pixmap_pressed = QtGui.QPixmap(image_pressed)
+        self.pixmap = _button_pixmap(image)
+        self.pixmap_hover = _button_pixmap(image_hover)
+        self.pixmap_pressed = _button_pixmap(image_pressed)
         self.size = size
+        # the image state to draw - normal, hover or pressed. Kept up to date by the mouse and press events, so
+        # painting doesn't need to query the mouse
+        self._state = "normal"
+        # whether the mouse is over the button, set by the enter and leave events
+        self._hover = False
         self.set_slots()
 
     def set_slots(self):
-        self.pressed.connect(self.update)
-        self.released.connect(self.update)
+        self.pressed.connect(self._on_pressed)
+        self.released.connect(self._on_released)
+
+    def _set_state(self, state):
+        """
+        Sets the image state and repaints the button, only when the state changes
+        :param state: the image state - normal, hover or pressed
+        """
+        if state != self._state:
+            self._state = state
+            self.update()
+
+    @pyqtSlot()
+    def _on_pressed(self):
+        self._set_state("pressed")
+
+    @pyqtSlot()
+    def _on_released(self):
+        self._set_state("hover" if self._hover else "normal")
 
     def paintEvent(self, event):
-        pix = self.pixmap_hover if self.underMouse() else self.pixmap
-        if self.isDown():
+        if self._state == "pressed":
             pix = self.pixmap_pressed
+        elif self._state == "hover":
+            pix = self.pixmap_hover
+        else:
+            pix = self.pixmap
         painter = QtGui.QPainter(self)
-        painter.drawPixmap(event.rect(), pix)
+        # draw the image over the whole button, the painter is already clipped to the area that needs repainting
+        painter.drawPixmap(self.rect(), pix)
 
     def set_image(self, state, image):
         """
@@ -1492,17 +1817,28 @@ class ImageButton(QtWidgets.QAbstractButton):
         :return:
         """
         if state == "pressed":
-            self.pixmap_pressed = QtGui.QPixmap(image)
+            self.pixmap_pressed = _button_pixmap(image)
         elif state == "hover":
-            self.pixmap_hover = QtGui.QPixmap(image)
+            self.pixmap_hover = _button_pixmap(image)
         else:
-            self.pixmap = QtGui.QPixmap(image)
+            self.pixmap = _button_pixmap(image)
+
+    def mouseReleaseEvent(self, event):
+        super(ImageButton, self).mouseReleaseEvent(event)
+        # a press dragged off the button is released without the released signal, so reset the state here too
+        if not self.isDown():
+            self._set_state("hover" if self._hover else "normal")
 
     def enterEvent(self, event):
-        self.update()
+        self._hover = True
+        # a press keeps its image while the mouse is outside and back over the button
+        if not self.isDown():
+            self._set_state("hover")
 
     def leaveEvent(self, event):
-        self.update()
+        self._hover = False
+        if not self.isDown():
+            self._set_state("normal")
 
     def sizeHint(self):
         return QtCore.QSize(self.size[0], self.size[1])
@@ -1512,30 +1848,83 @@ class SliderWidget(QtWidgets.QSlider):
     """
     Custom slider
     """
+    def __init__(self, *args, **kwargs):
+        super(SliderWidget, self).__init__(*args, **kwargs)
+        # groove geometry used to convert a mouse position to a value, see _get_groove_geometry. Cleared when the
+        # size or style changes
+        self._groove_geometry = None
+
+    def resizeEvent(self, event):
+        super(SliderWidget, self).resizeEvent(event)
+        self._groove_geometry = None
+
+    def changeEvent(self, event):
+        super(SliderWidget, self).changeEvent(event)
+        if event.type() in (
+            QtCore.QEvent.StyleChange, QtCore.QEvent.FontChange, QtCore.QEvent.LayoutDirectionChange
+        ):
+            self._groove_geometry = None
+
     def mousePressEvent(self, event):
         super(SliderWidget, self).mousePressEvent(event)
         if event.button() == QtCore.Qt.LeftButton:
             val = self.pixel_pos_to_range_value(event.pos())
             self.setValue(val)
 
+    def _get_groove_geometry(self):
+        """
+        Gets the groove geometry from the style, only asking the style again when the slider was resized, restyled or
+        its orientation or appearance changed
+        :return: a tuple of the start of the groove, the length the handle can move, the offset from the handle's
+        center to its top left corner, and whether the slider is upside down
+        """
+        key = (self.orientation(), self.invertedAppearance())
+        if self._groove_geometry is None or self._groove_geometry[0] != key:
+            opt = QtWidgets.QStyleOptionSlider()
+            self.initStyleOption(opt)
+            gr = self.style().subControlRect(QtWidgets.QStyle.CC_Slider, opt, QtWidgets.QStyle.SC_SliderGroove, self)
+            sr = self.style().subControlRect(QtWidgets.QStyle.CC_Slider, opt, QtWidgets.QStyle.SC_SliderHandle, self)
+
+            if self.orientation() == QtCore.Qt.Horizontal:
+                sliderLength = sr.width()
+                sliderMin = gr.x()
+                sliderMax = gr.right() - sliderLength + 1
+            else:
+                sliderLength = sr.height()
+                sliderMin = gr.y()
+                sliderMax = gr.bottom() - sliderLength + 1
+            self._groove_geometry = (
+                key, sliderMin, sliderMax - sliderMin, sr.topLeft() - sr.center(), opt.upsideDown
+            )
+        return self._groove_geometry[1:]
+
     def pixel_pos_to_range_value(self, pos):
-        opt = QtWidgets.QStyleOptionSlider()
-        self.initStyleOption(opt)
-        gr = self.style().subControlRect(QtWidgets.QStyle.CC_Slider, opt, QtWidgets.QStyle.SC_SliderGroove, self)
-        sr = self.style().subControlRect(QtWidgets.QStyle.CC_Slider, opt, QtWidgets.QStyle.SC_SliderHandle, self)
-
-        if self.orientation() == QtCore.Qt.Horizontal:
-            sliderLength = sr.width()
-            sliderMin = gr.x()
-            sliderMax = gr.right() - sliderLength + 1
-        else:
-            sliderLength = sr.height()
-            sliderMin = gr.y()
-            sliderMax = gr.bottom() - sliderLength + 1
-        pr = pos - sr.center() + sr.topLeft()
+        sliderMin, sliderSpan, handleOffset, upsideDown = self._get_groove_geometry()
+        pr = pos + handleOffset
         p = pr.x() if self.orientation() == QtCore.Qt.Horizontal else pr.y()
         return QtWidgets.QStyle.sliderValueFromPosition(self.minimum(), self.maximum(), p - sliderMin,
-                                                        sliderMax - sliderMin, opt.upsideDown)
+                                                        sliderSpan, upsideDown)
+
+
+# text color for tree columns without a color, bound once instead of looked up for every column
+_TREE_TEXT_DEFAULT_COLOR = QtCore.Qt.white
+
+
+def _tree_text_color(color):
+    """
+    Gets the text color for a tree column
+    :param color: the color given for the column, a QColor, anything a QColor can be made from, or None
+    :return: the color to use. QColors such as the module's GREEN or RED are used as is, since many rows share them,
+    so a new QColor is only made for other values. None or a color that doesn't convert gives white
+    """
+    if isinstance(color, QtGui.QColor):
+        return color
+    if color is None:
+        return _TREE_TEXT_DEFAULT_COLOR
+    color = QtGui.QColor(color)
+    if not color:
+        return _TREE_TEXT_DEFAULT_COLOR
+    return color
 
 
 class CheckboxTreeWidgetItem(object):
@@ -1545,28 +1934,24 @@ class CheckboxTreeWidgetItem(object):
     no color given.
     ex: items = ["text1","text2"], colors=None or colors=[None, QtCore.Qt.red]
     """
-    def __init__(self, items, colors=None):
-        self.__columns = []
-
-        for index in range(0, len(items)):
-            # make sure colors given and not None
-            if colors:
-                # get the color
-                color = QtGui.QColor(colors[index])
-                # if color is none, set to white
-                if not color:
-                    color = QtCore.Qt.white
-            # no colors given set to white
-            else:
-                color = QtCore.Qt.white
+    # trees can hold thousands of these, so no per instance __dict__
+    __slots__ = ('__texts', '__colors')
 
-            item = {"text": items[index], "color": color}
-            self.__columns.append(item)
+    def __init__(self, items, colors=None):
+        # the column texts and colors are kept in two parallel tuples rather than a (text, color) pair per column
+        self.__texts = tuple(items)
+        # make sure colors given and not None
+        if colors:
+            # map over the sliced colors builds a list of the final size up front, a generator would grow the tuple
+            self.__colors = tuple(map(_tree_text_color, colors[:len(self.__texts)]))
+        # no colors given set to white
+        else:
+            self.__colors = (_TREE_TEXT_DEFAULT_COLOR,) * len(self.__texts)
 
     def col_count(self):
         """Column count - ie length of the list
         """
-        return len(self.__columns)
+        return len(self.__texts)
 
     def text(self, index):
         """
@@ -1574,7 +1959,7 @@ class CheckboxTreeWidgetItem(object):
         :param index: column number
         :return: the text as a string
         """
-        return self.__columns[index]["text"]
+        return self.__texts[index]
 
     def color(self, index):
         """
@@ -1582,7 +1967,7 @@ class CheckboxTreeWidgetItem(object):
         :param index: column number
         :return: a QColor
         """
-        return self.__columns[index]["color"]
+        return self.__colors[index]
 
 
 class CheckboxTreeWidget(QtWidgets.QTreeWidget):
@@ -1619,6 +2004,9 @@ class CheckboxTreeWidget(QtWidgets.QTreeWidget):
         self.font_bold.setBold(True)
         self.font_italic = QtGui.QFont()
         self.font_italic.setItalic(True)
+        # tree items by their first column text, lets rows be found without walking the whole tree. A list since
+        # children under different parents can share the same text
+        self._items_by_text = dict()
         self.build_checkbox_tree(tree_items, columns, expand, checked)
         self.itemExpanded.connect(self._resize_on_expand)
 
@@ -1636,53 +2024,73 @@ class CheckboxTreeWidget(QtWidgets.QTreeWidget):
 
         if tree_items:
             self.setColumnCount(columns)
+            # don't repaint as each row is inserted, the tree is drawn once after it is populated and expanded. Signals
+            # are held too, the rows are all new so there's nothing for a slot to react to row by row, and expanding
+            # would otherwise resize the columns per row. If sorting, sort once at the end rather than per insert
+            self.setUpdatesEnabled(False)
+            signals_blocked = self.blockSignals(True)
+            sorting_enabled = self.isSortingEnabled()
+            self.setSortingEnabled(False)
+            # looked up once rather than for every column of every child
+            supported_image_formats = self.__supported_image_formats
+            # rows are built detached from the tree, then added together in one insert
+            parents = []
+            # rows with images can be taller than text rows
+            image_found = False
             # go through tree and build
             for tree_item in tree_items:
-                parent = QtWidgets.QTreeWidgetItem(self)
+                parent = QtWidgets.QTreeWidgetItem()
+                parents.append(parent)
                 root_item = tree_item["root"]
                 # build main column rows
                 for col_index in range(0, root_item.col_count()):
-                    parent.setTextColor(col_index, root_item.color(col_index))
+                    parent.setForeground(col_index, QtGui.QBrush(root_item.color(col_index)))
                     self._set_styling(parent, root_item.text(col_index), col_index)
                 parent.setFlags(parent.flags() | QtCore.Qt.ItemIsTristate | QtCore.Qt.ItemIsUserCheckable)
+                self._items_by_text.setdefault(parent.text(0), []).append(parent)
                 # build children rows if they exist - keys will be 2 if they exist
                 if len(tree_item.keys()) > 1:
                     child_items = tree_item["children"]
+                    # children are built detached too and given to the parent in one call
+                    children = []
                     for child_item in child_items:
-                        child = QtWidgets.QTreeWidgetItem(parent)
+                        child = QtWidgets.QTreeWidgetItem()
+                        children.append(child)
                         child.setFlags(child.flags() | QtCore.Qt.ItemIsUserCheckable)
                         for col_index in range(0, child_item.col_count()):
-                            # flag indicates if column is image or text
-                            image_found = False
+                            col_text = child_item.text(col_index)
                             # check if it's an image
-                            for image_format in self.__supported_image_formats:
-                                if image_format in child_item.text(col_index):
-                                    image_found = True
-                                    break
-                            if image_found:
-                                child.setData(
-                                    col_index,
-                                    QtCore.Qt.DecorationRole,
-                                    QtGui.QPixmap(child_item.text(col_index))
-                                )
+                            if any(image_format in col_text for image_format in supported_image_formats):
+                                child.setData(col_index, QtCore.Qt.DecorationRole, QtGui.QPixmap(col_text))
+                                image_found = True
                             else:
-                                child.setTextColor(col_index, child_item.color(col_index))
-                                self._set_styling(child, child_item.text(col_index), col_index)
+                                child.setForeground(col_index, QtGui.QBrush(child_item.color(col_index)))
+                                self._set_styling(child, col_text, col_index)
+                        self._items_by_text.setdefault(child.text(0), []).append(child)
                         if checked:
                             child.setCheckState(0, QtCore.Qt.Checked)
                         else:
                             child.setCheckState(0, QtCore.Qt.Unchecked)
+                    parent.addChildren(children)
                 else:
                     if checked:
                         parent.setCheckState(0, QtCore.Qt.Checked)
                     else:
                         parent.setCheckState(0, QtCore.Qt.Unchecked)
+            self.addTopLevelItems(parents)
+            # text only rows are all the same height, so let the view skip measuring every row when laying out
+            # and scrolling
+            self.setUniformRowHeights(not image_found)
+            # expand once all rows exist, qt walks the whole tree in one call
             if expand:
                 self.expandAll()
             # resize columns to fit contents better, but skip last column
             for col in range(0, columns-1):
                 self.resizeColumnToContents(col)
                 self.setColumnWidth(col, self.columnWidth(col) + self.__col_space)
+            self.setSortingEnabled(sorting_enabled)
+            self.blockSignals(signals_blocked)
+            self.setUpdatesEnabled(True)
 
     def set_checked(self, items_to_check):
         """
@@ -1693,21 +2101,21 @@ class CheckboxTreeWidget(QtWidgets.QTreeWidget):
             'item name': text to find
         }
         """
-        iterator = QtWidgets.QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            for item_to_check in items_to_check:
+        # look the rows up by their text instead of comparing every row in the tree to every item to check.
+        # Repaint once after all rows are checked
+        self.setUpdatesEnabled(False)
+        for item_to_check in items_to_check:
+            for item in self._items_by_text.get(item_to_check['item name'], []):
                 # check if there is a parent, ie item to check is a child
                 if item_to_check['parent']:
-                    # see if the text matches and parent matches for the item
-                    if item_to_check['item name'] == str(item.text(0)) and \
-                            str(item.parent().text(0)) == item_to_check['parent']:
+                    # see if the parent matches for the item
+                    parent = item.parent()
+                    if parent is not None and str(parent.text(0)) == item_to_check['parent']:
                         item.setCheckState(0, QtCore.Qt.Checked)
                 # no parent
                 else:
-                    if item_to_check['item name'] == str(item.text(0)):
-                        item.setCheckState(0, QtCore.Qt.Checked)
-            iterator += 1
+                    item.setCheckState(0, QtCore.Qt.Checked)
+        self.setUpdatesEnabled(True)
 
     @staticmethod
     def get_item_at_position(item, column):
@@ -1737,11 +2145,25 @@ class CheckboxTreeWidget(QtWidgets.QTreeWidget):
         :return: a list of the checked items
         """
         checked = []
-        iterator = QtWidgets.QTreeWidgetItemIterator(self, QtWidgets.QTreeWidgetItemIterator.Checked)
-        while iterator.value():
-            item = iterator.value()
-            checked.append(str(item.text(0)))
-            iterator += 1
+        # bind the method used every row once
+        add_checked = checked.append
+        # tree is only one level deep, so walk parents and only look at children when the parent is checked or
+        # partially checked. An unchecked parent means none of its children are checked
+        for parent_index in xrange(self.topLevelItemCount()):
+            parent = self.topLevelItem(parent_index)
+            parent_state = parent.checkState(0)
+            if parent_state == QtCore.Qt.Unchecked:
+                continue
+            if parent_state == QtCore.Qt.Checked:
+                # parent and all of its children are checked
+                add_checked(str(parent.text(0)))
+                for child_index in xrange(parent.childCount()):
+                    add_checked(str(parent.child(child_index).text(0)))
+            else:
+                for child_index in xrange(parent.childCount()):
+                    child = parent.child(child_index)
+                    if child.checkState(0) == QtCore.Qt.Checked:
+                        add_checked(str(child.text(0)))
         return checked
 
     def get_tree_unchecked(self):
@@ -1761,8 +2183,11 @@ class CheckboxTreeWidget(QtWidgets.QTreeWidget):
         """
         Simply expands the tree
         """
+        # expand and resize the columns without repainting in between, the tree is drawn once at the end
+        self.setUpdatesEnabled(False)
         self.expandAll()
         self._resize_on_expand()
+        self.setUpdatesEnabled(True)
 
     def collapse_all(self):
         """
@@ -1789,59 +2214,70 @@ class CheckboxTreeWidget(QtWidgets.QTreeWidget):
         :param existing_text: the existing item text
         :param updated_item: the updated item as a CheckboxTreeWidgetItem
         """
-        iterator = QtWidgets.QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-            if item.text(0) == existing_text:
-                for col_index in range(0, updated_item.col_count()):
-                    item.setTextColor(col_index, updated_item.color(col_index))
-                    item.setText(col_index, updated_item.text(col_index))
-            iterator += 1
+        items = self._items_by_text.pop(existing_text, [])
+        # the brushes are the same for every matching row, so make them once. Repaint once after all cells change
+        brushes = [QtGui.QBrush(updated_item.color(col_index)) for col_index in range(0, updated_item.col_count())]
+        self.setUpdatesEnabled(False)
+        for item in items:
+            for col_index, brush in enumerate(brushes):
+                item.setForeground(col_index, brush)
+                item.setText(col_index, updated_item.text(col_index))
+        self.setUpdatesEnabled(True)
+        # re-index under the new text, which may be the same as the old text
+        if items:
+            self._items_by_text.setdefault(updated_item.text(0), []).extend(items)
 
     def clear_all_items(self):
         """Clear the tree
         """
-        iterator = QtWidgets.QTreeWidgetItemIterator(self, QtWidgets.QTreeWidgetItemIterator.All)
-        while iterator.value():
-            iterator.value().takeChildren()
-            iterator += 1
-        i = self.topLevelItemCount()
-        while i > -1:
-            self.takeTopLevelItem(i)
-            i -= 1
+        # qt deletes every item in one pass
+        self.setUpdatesEnabled(False)
+        self.clear()
+        self.setUpdatesEnabled(True)
+        self._items_by_text = dict()
 
     def hide_items(self, item_list):
         """
         Hides rows based on the list given
         :param item_list: a list of pyqt4 Tree Widget items - more robust, don't have to worry about parents and same
-        named children
+        named children. Can also be a list of first column text, hides every row with that text
         """
-        iterator = QtWidgets.QTreeWidgetItemIterator(self)
-        while iterator.value():
-            tree_item = iterator.value()
-            for item in item_list:
-                if tree_item == item:
-                    tree_item.setHidden(True)
-            iterator += 1
+        self._set_items_hidden(item_list, True)
 
     def show_items(self, item_list, show_all=False):
         """
         Shows rows based on the list given
         :param item_list: a list of pyqt4 Tree Widget items - more robust, don't have to worry about parents and same
-        named children
+        named children. Can also be a list of first column text, shows every row with that text
         :param show_all: optional boolean indicating all items should be shown. Ignores item_list when this flag
         is True
         """
-        iterator = QtWidgets.QTreeWidgetItemIterator(self)
-        while iterator.value():
-            tree_item = iterator.value()
-            if show_all:
-                tree_item.setHidden(False)
+        if show_all:
+            # only visit the hidden rows, the rest are already shown
+            iterator = QtWidgets.QTreeWidgetItemIterator(self, QtWidgets.QTreeWidgetItemIterator.Hidden)
+            while iterator.value():
+                iterator.value().setHidden(False)
+                iterator += 1
+        else:
+            self._set_items_hidden(item_list, False)
+
+    def _set_items_hidden(self, item_list, hidden):
+        """
+        Hides or shows rows, only visits the rows given instead of the whole tree
+        :param item_list: a list of pyqt4 Tree Widget items or first column text
+        :param hidden: True to hide the rows, False to show them
+        """
+        # set removes repeated entries, and rows already in the wanted state are skipped since every setHidden call
+        # makes the view lay out again
+        for item in set(item_list):
+            if isinstance(item, QtWidgets.QTreeWidgetItem):
+                # only touch rows that belong to this tree
+                if item.treeWidget() is self and item.isHidden() != hidden:
+                    item.setHidden(hidden)
             else:
-                for item in item_list:
-                    if tree_item == item:
-                        tree_item.setHidden(False)
-            iterator += 1
+                for tree_item in self._items_by_text.get(item, []):
+                    if tree_item.isHidden() != hidden:
+                        tree_item.setHidden(hidden)
 
     def _resize_on_expand(self):
         """
@@ -412,15 +412,21 @@ def move_file(src, dest):
 
 def move_files(src, dest):
     """
-    moves files from src to dest (ie copies to new path and deletes from old path).
+    moves files from src to dest (ie copies to new path and deletes from old path). Files are renamed into dest
+    directly, which is a fast metadata only operation when src and dest are on the same drive. Falls back to
+    shutil.move, which copies, when the rename fails - for example a different drive or the file exists in dest.
     :param src: source dir or list of files
     :param dest: destination directory
     :except IOError, OSError: returns the file src and dest and error
     :return: None if no errors, otherwise return error as string
     """
+    file_path = None
     try:
         for file_path in src:
-            shutil.move(file_path, dest)
+            try:
+                os.rename(file_path, os.path.join(dest, os.path.basename(file_path.rstrip("\\/"))))
+            except OSError:
+                shutil.move(file_path, dest)
         return None
     except (IOError, OSError) as e:
         error_msg = "Could not move {0} to {1}. Received error {2}".format(file_path, dest, e)
@@ -428,6 +434,29 @@ def move_files(src, dest):
         return error_msg
 
 
+def move_dir(src, dest):
+    """
+    moves a directory to a new path. Tries a rename first, which on the same drive only updates file system metadata
+    instead of copying every file. Falls back to copying the directory and removing the original if the rename fails,
+    for example when moving to a different drive.
+    :param src: source directory
+    :param dest: the new path of the directory, not its parent. Must not exist, its parent directory must exist
+    :except IOError, OSError, shutil.Error: returns the src and dest and error
+    :return: None if no errors, otherwise return error as string
+    """
+    try:
+        try:
+            os.rename(src, dest)
+        except OSError:
+            shutil.copytree(src, dest)
+            shutil.rmtree(src, ignore_errors=True)
+        return None
+    except (IOError, OSError, shutil.Error) as e:
+        error_msg = "Could not move {0} to {1}. Received error {2}".format(src, dest, e)
+        logger.error(error_msg)
+        return error_msg
+
+
 def delete_file(file_path):
     """
     Deletes file
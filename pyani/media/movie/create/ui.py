@@ -286,6 +286,7 @@ class AniShootGui(pyani.core.ui.AniQMainWindow):
         :param event: the window close event
         """
         self.shoot.cleanup()
+        super(AniShootGui, self).closeEvent(event)
 
     def movie_combine_update(self):
         """